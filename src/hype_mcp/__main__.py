@@ -25,7 +25,7 @@ async def async_main():
 
     server = HyperliquidMCPServer(config)
 
-    await server.run()
+    await server.arun()
 
 
 if __name__ == "__main__":
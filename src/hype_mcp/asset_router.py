@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Set
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Set
 
 from .errors import APIError, AssetNotFoundError
 from .validation import _normalize_symbol
 
+# Shared pool so the perp and spot metadata requests run concurrently.
+_METADATA_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="asset-router-meta"
+)
+
+# Process-wide metadata keyed by API base URL, so routers created for the same
+# endpoint can skip the initial fetch: base_url -> (fetched_at, perp, spot).
+_SHARED_METADATA: Dict[str, tuple[float, Any, Any]] = {}
+_SHARED_METADATA_LOCK = threading.Lock()
+
+
+# Deletes every ASCII character that cannot appear in a normalized alias.
+_ALIAS_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(code)
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) in "-_")
+    ),
+)
+
+
+def _consume_refresh_error(task: asyncio.Task[None]) -> None:
+    """Mark background refresh failures as retrieved; callers retry on demand."""
+    if not task.cancelled():
+        task.exception()
+
 
 @dataclass(frozen=True)
 class SpotMarketRoute:
@@ -20,7 +53,7 @@ class SpotMarketRoute:
     is_canonical: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpotTokenInfo:
     """Represents a tradable spot token."""
 
@@ -31,21 +64,30 @@ class SpotTokenInfo:
     market_index: Optional[int] = None
     quote_token_index: Optional[int] = None
     quote_symbol: Optional[str] = None
+    _api_symbol: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def api_symbol(self) -> str:
-        """Return the string identifier required by the Exchange API."""
+    def __post_init__(self) -> None:
         target_index = (
             self.market_index if self.market_index is not None else self.token_index
         )
-        return f"@{target_index}"
+        object.__setattr__(self, "_api_symbol", f"@{target_index}")
+
+    @property
+    def api_symbol(self) -> str:
+        """Return the string identifier required by the Exchange API."""
+        return self._api_symbol
 
 
 class AssetRouter:
     """Maps user-friendly symbols to spot token identifiers."""
 
     REFRESH_TTL = 86400.0  # seconds (1 day)
+    HARD_TTL = 2 * REFRESH_TTL  # beyond this, callers wait for fresh metadata
     QUOTE_PRIORITY = ("USDC", "UETH", "UBTC")
+    _QUOTE_RANKS = {name: rank for rank, name in enumerate(QUOTE_PRIORITY)}
+    RESOLVE_CACHE_SIZE = 256
+    MISS_REFRESH_COOLDOWN = 5.0  # seconds between miss-triggered refreshes per symbol
+    MISS_CACHE_SIZE = 1024
 
     def __init__(self, info_client: Any) -> None:
         self.info_client = info_client
@@ -54,18 +96,50 @@ class AssetRouter:
         self._market_routes: Dict[int, SpotMarketRoute] = {}
         self._perp_symbols: Set[str] = set()
         self._last_refresh: float = 0.0
-        self.refresh()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self._refresh_lock = threading.Lock()
+        self._metadata_snapshot: Optional[tuple[Any, Any]] = None
+        self._resolve_cache: OrderedDict[str, SpotTokenInfo] = OrderedDict()
+        self._miss_times: Dict[str, float] = {}
+
+    async def ensure_ready(self) -> None:
+        """Load the routing tables if they have not been fetched yet."""
+        if not self._spot_tokens:
+            await self._await_refresh()
 
     def refresh(self) -> None:
         """Fetch metadata from Hyperliquid and rebuild routing tables."""
-        try:
-            perp_meta = self.info_client.meta()
-            spot_meta = self.info_client.spot_meta()
-        except Exception as exc:  # pragma: no cover - network error pass-through
-            raise APIError(
-                message=f"Failed to load asset metadata from Hyperliquid: {exc}",
-                api_response=None,
-            ) from exc
+        with self._refresh_lock:
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        base_url = getattr(self.info_client, "base_url", None)
+        if not isinstance(base_url, str):
+            base_url = None
+
+        shared = None
+        if base_url is not None and not self._spot_tokens:
+            # First load: reuse metadata a sibling router fetched recently.
+            with _SHARED_METADATA_LOCK:
+                shared = _SHARED_METADATA.get(base_url)
+            if shared is not None and time.time() - shared[0] > self.REFRESH_TTL:
+                shared = None
+
+        if shared is not None:
+            fetched_at, perp_meta, spot_meta = shared
+        else:
+            perp_future = _METADATA_EXECUTOR.submit(self.info_client.meta)
+            spot_future = _METADATA_EXECUTOR.submit(self.info_client.spot_meta)
+            perp_meta = self._metadata_result(perp_future)
+            spot_meta = self._metadata_result(spot_future)
+            fetched_at = time.time()
+
+        if self._spot_tokens and self._metadata_snapshot == (perp_meta, spot_meta):
+            # The info endpoint is a POST without ETag/Last-Modified support, so
+            # compare payloads and skip the rebuild when nothing has changed.
+            self._last_refresh = fetched_at
+            self._share_metadata(base_url, fetched_at, perp_meta, spot_meta)
+            return
 
         perp_universe = perp_meta.get("universe", [])
         spot_tokens = spot_meta.get("tokens") or []
@@ -92,7 +166,7 @@ class AssetRouter:
 
             route = market_routes.get(token_index)
             info = SpotTokenInfo(
-                symbol=token_name.upper(),
+                symbol=sys.intern(token_name.upper()),
                 token_index=token_index,
                 sz_decimals=token.get("szDecimals", 0),
                 full_name=token.get("fullName"),
@@ -101,12 +175,12 @@ class AssetRouter:
                 quote_symbol=route.quote_symbol if route else None,
             )
             new_spot_tokens[info.symbol] = info
-            for alias in self._derive_aliases(token):
-                if alias and alias not in new_alias_map:
-                    new_alias_map[alias] = info
+            for alias in self._iter_aliases(token):
+                if alias not in new_alias_map:
+                    new_alias_map[sys.intern(alias)] = info
             canonical_alias = self._normalize_alias(info.symbol)
             if canonical_alias:
-                new_alias_map[canonical_alias] = info
+                new_alias_map[sys.intern(canonical_alias)] = info
 
         if not new_spot_tokens:
             if not self._spot_tokens:
@@ -120,48 +194,132 @@ class AssetRouter:
         self._spot_tokens = new_spot_tokens
         self._spot_alias_map = new_alias_map
         self._market_routes = market_routes
-        self._last_refresh = time.time()
+        self._resolve_cache.clear()
+        self._miss_times.clear()
+        self._metadata_snapshot = (perp_meta, spot_meta)
+        self._last_refresh = fetched_at
+        self._share_metadata(base_url, fetched_at, perp_meta, spot_meta)
+
+    @staticmethod
+    def _share_metadata(
+        base_url: Optional[str], fetched_at: float, perp_meta: Any, spot_meta: Any
+    ) -> None:
+        """Publish successfully applied metadata for other routers on this API."""
+        if base_url is None:
+            return
+        with _SHARED_METADATA_LOCK:
+            current = _SHARED_METADATA.get(base_url)
+            if current is None or current[0] < fetched_at:
+                _SHARED_METADATA[base_url] = (fetched_at, perp_meta, spot_meta)
+
+    @staticmethod
+    def _metadata_result(future: Future[Any]) -> Any:
+        """Unwrap a metadata request, surfacing failures as APIError."""
+        try:
+            return future.result()
+        except Exception as exc:  # pragma: no cover - network error pass-through
+            raise APIError(
+                message=f"Failed to load asset metadata from Hyperliquid: {exc}",
+                api_response=None,
+            ) from exc
 
-    def resolve_spot_symbol(self, symbol: str) -> SpotTokenInfo:
+    async def resolve_spot_symbol(self, symbol: str) -> SpotTokenInfo:
         """Return the spot token information for a user supplied symbol."""
-        self._refresh_if_stale()
+        await self.ensure_ready()
+        await self._refresh_if_stale()
+        cached = self._resolve_cache.get(symbol)
+        if cached is not None:
+            self._resolve_cache.move_to_end(symbol)
+            return cached
         normalized = _normalize_symbol(symbol)
-        match = self._spot_alias_map.get(normalized)
+        alias_map = self._spot_alias_map
+        match = alias_map.get(normalized)
         if match:
+            self._remember_resolution(symbol, match, alias_map)
             return match
         # Symbol is unknown under the cached metadata; force a refresh in case
-        # a new token was listed after the last refresh.
-        self.refresh()
-        match = self._spot_alias_map.get(normalized)
+        # a new token was listed after the last refresh, unless this symbol
+        # already missed very recently.
+        now = time.time()
+        if now - self._miss_times.get(normalized, 0.0) < self.MISS_REFRESH_COOLDOWN:
+            raise AssetNotFoundError(symbol)
+        if len(self._miss_times) >= self.MISS_CACHE_SIZE:
+            self._miss_times.clear()
+        self._miss_times[normalized] = now
+        await self._await_refresh()
+        alias_map = self._spot_alias_map
+        match = alias_map.get(normalized)
         if match:
+            self._remember_resolution(symbol, match, alias_map)
             return match
         raise AssetNotFoundError(symbol)
 
-    def _refresh_if_stale(self) -> None:
-        if (time.time() - self._last_refresh) > self.REFRESH_TTL:
-            self.refresh()
+    def _remember_resolution(
+        self,
+        symbol: str,
+        match: SpotTokenInfo,
+        alias_map: Dict[str, SpotTokenInfo],
+    ) -> None:
+        # Skip caching if a background refresh swapped the tables meanwhile.
+        if alias_map is not self._spot_alias_map:
+            return
+        self._resolve_cache[symbol] = match
+        if len(self._resolve_cache) > self.RESOLVE_CACHE_SIZE:
+            self._resolve_cache.popitem(last=False)
+
+    async def _refresh_if_stale(self) -> None:
+        age = time.time() - self._last_refresh
+        if age > self.HARD_TTL:
+            await self._await_refresh()
+        elif age > self.REFRESH_TTL:
+            # Serve the cached tables and revalidate in the background.
+            self._start_refresh()
+
+    def _start_refresh(self) -> asyncio.Task[None]:
+        """Return the in-flight refresh task, starting one if none is running."""
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.create_task(asyncio.to_thread(self.refresh))
+            task.add_done_callback(_consume_refresh_error)
+            self._refresh_task = task
+        return task
+
+    async def _await_refresh(self) -> None:
+        # Shield so a cancelled caller does not abort a refresh other callers share.
+        await asyncio.shield(self._start_refresh())
 
     def _build_market_routes(
         self, tokens: list[dict[str, Any]], markets: list[dict[str, Any]]
     ) -> Dict[int, SpotMarketRoute]:
         """Map token indices to their preferred markets with deterministic priority."""
-        name_to_index = {
-            (token.get("name") or "").upper(): token.get("index")
-            for token in tokens
-            if token.get("index") is not None
-        }
-        token_lookup = {
-            token.get("index"): token
-            for token in tokens
-            if token.get("index") is not None
+        # Single pass over tokens. Token indices are small and dense, so quote
+        # names live in a list indexed by token index rather than a dict.
+        quote_ranks = self._QUOTE_RANKS
+        quote_indices: Dict[str, int] = {}
+        upper_names: list[Optional[str]] = []
+        for token in tokens:
+            index = token.get("index")
+            if not isinstance(index, int) or index < 0:
+                continue
+            name = token.get("name")
+            if not isinstance(name, str):
+                continue
+            upper_name = sys.intern(name.upper())
+            if index >= len(upper_names):
+                upper_names.extend([None] * (index + 1 - len(upper_names)))
+            upper_names[index] = upper_name
+            if upper_name in quote_ranks:
+                quote_indices[upper_name] = index
+        quote_priority = {
+            index: quote_ranks[name] for name, index in quote_indices.items()
         }
-        quote_priority: Dict[Optional[int], int] = {}
-        for rank, quote_name in enumerate(self.QUOTE_PRIORITY):
-            idx = name_to_index.get(quote_name)
-            if idx is not None:
-                quote_priority[idx] = rank
+        name_count = len(upper_names)
 
-        market_routes: Dict[int, SpotMarketRoute] = {}
+        # Keep only a compact (rank, quote_index, is_canonical) tuple per base
+        # token while scanning, and build route objects for the winners only.
+        # Lower ranks win; on a full tie the later market wins.
+        default_priority = len(self.QUOTE_PRIORITY)
+        best: Dict[int, tuple[tuple[int, bool, int], int, bool]] = {}
         for market in markets:
             pair = market.get("tokens") or []
             if len(pair) < 2:
@@ -175,24 +333,29 @@ class AssetRouter:
             if market_index is None:
                 continue
 
-            quote_symbol = None
-            quote_token = token_lookup.get(quote_index)
-            if quote_token:
-                quote_name = quote_token.get("name")
-                if isinstance(quote_name, str):
-                    quote_symbol = quote_name.upper()
-            candidate = SpotMarketRoute(
-                market_index=market_index,
-                quote_index=quote_index,
-                quote_symbol=quote_symbol,
-                is_canonical=bool(market.get("isCanonical")),
-            )
-            existing = market_routes.get(base_index)
-            market_routes[base_index] = self._select_market_route(
-                existing, candidate, quote_priority
+            is_canonical = bool(market.get("isCanonical"))
+            rank = (
+                quote_priority.get(quote_index, default_priority),
+                not is_canonical,
+                market_index,
             )
+            existing = best.get(base_index)
+            if existing is None or rank <= existing[0]:
+                best[base_index] = (rank, quote_index, is_canonical)
 
-        return market_routes
+        return {
+            base_index: SpotMarketRoute(
+                market_index=rank[2],
+                quote_index=quote_index,
+                quote_symbol=(
+                    upper_names[quote_index]
+                    if isinstance(quote_index, int) and 0 <= quote_index < name_count
+                    else None
+                ),
+                is_canonical=is_canonical,
+            )
+            for base_index, (rank, quote_index, is_canonical) in best.items()
+        }
 
     @staticmethod
     def _extract_market_index(market: dict[str, Any]) -> Optional[int]:
@@ -208,70 +371,40 @@ class AssetRouter:
                 return int(maybe_number)
         return None
 
-    def _select_market_route(
-        self,
-        existing: Optional[SpotMarketRoute],
-        candidate: SpotMarketRoute,
-        quote_priority: Dict[Optional[int], int],
-    ) -> SpotMarketRoute:
-        """Choose the better route based on quote priority and canonical status."""
-        if existing is None:
-            return candidate
-
-        default_priority = len(self.QUOTE_PRIORITY)
-        existing_priority = quote_priority.get(existing.quote_index, default_priority)
-        candidate_priority = quote_priority.get(candidate.quote_index, default_priority)
-
-        if candidate_priority != existing_priority:
-            return candidate if candidate_priority < existing_priority else existing
+    def _iter_aliases(self, token: dict[str, Any]) -> Iterator[str]:
+        """Yield every alias string that should route to this token.
 
-        if candidate.is_canonical != existing.is_canonical:
-            return candidate if candidate.is_canonical else existing
-
-        if candidate.market_index != existing.market_index:
-            return (
-                candidate
-                if candidate.market_index < existing.market_index
-                else existing
-            )
-
-        return candidate
-
-    def _derive_aliases(self, token: dict[str, Any]) -> Set[str]:
-        """Generate all alias strings that should route to this token."""
-        aliases: Set[str] = set()
+        Duplicates are possible; callers dedupe on insertion.
+        """
         name = token.get("name")
         if name:
             normalized = self._normalize_alias(name)
             if normalized:
-                aliases.add(normalized)
+                yield normalized
             if name.startswith("U") and len(name) > 1:
                 stripped = self._normalize_alias(name[1:])
                 if stripped:
-                    aliases.add(stripped)
+                    yield stripped
 
         full_name = token.get("fullName") or ""
         if full_name:
             full_alias = self._normalize_alias(full_name)
             if full_alias:
-                aliases.add(full_alias)
+                yield full_alias
                 if full_alias.startswith("UNIT") and len(full_alias) > 4:
-                    trimmed = full_alias[4:]
-                    if trimmed:
-                        aliases.add(trimmed)
+                    yield full_alias[4:]
 
         token_id = token.get("tokenId")
         if token_id:
             alias = self._normalize_alias(token_id)
             if alias:
-                aliases.add(alias)
-
-        return aliases
+                yield alias
 
     @staticmethod
     def _normalize_alias(value: str) -> Optional[str]:
         """Normalize metadata derived aliases into the same format as user input."""
-        cleaned = "".join(
-            ch for ch in value.upper().strip() if ch.isalnum() or ch in {"-", "_"}
-        )
+        cleaned = value.upper().translate(_ALIAS_DELETE_TABLE)
+        if not cleaned.isascii():
+            # Rare non-ASCII names keep the Unicode-aware isalnum() filter.
+            cleaned = "".join(ch for ch in cleaned if ch.isalnum() or ch in "-_")
         return cleaned or None
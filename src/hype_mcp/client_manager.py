@@ -1,11 +1,96 @@
 """Hyperliquid client manager for Info and Exchange endpoints."""
 
 import asyncio
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Optional
 
-from eth_account import Account
-from hyperliquid.exchange import Exchange
+import requests
 from hyperliquid.info import Info
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import serialization
+
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+    from hyperliquid.exchange import Exchange
+
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+VALIDATE_TIMEOUT = 5.0  # seconds
+
+
+def _build_session() -> requests.Session:
+    """Create the HTTP session shared by the Info and Exchange clients."""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    # Only connection failures are retried; orders must never be re-sent.
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, read=0, other=0, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+class _Info(Info):
+    """Info client that decodes responses with the faster JSON parser.
+
+    Identical requests that overlap in time share one HTTP round-trip, so
+    concurrent tools asking for ``allMids`` or ``meta`` hit the API once.
+    Every waiter receives the same decoded object, so callers must treat
+    results as read-only and copy before modifying them.
+    """
+
+    def __init__(self, *args: Any, session: requests.Session, **kwargs: Any) -> None:
+        # Set up before Info.__init__, which already posts metadata requests.
+        self._shared_session = session
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        try:
+            super().__init__(*args, **kwargs)
+        except BaseException:
+            # The websocket thread starts before the metadata fetches and is not
+            # a daemon, so a failed fetch must not leave it running.
+            ws_manager = getattr(self, "ws_manager", None)
+            if ws_manager is not None:
+                ws_manager.stop()
+            raise
+        # API.__init__ opened a session of its own that post() never uses.
+        self.session.close()
+        self.session = session
+
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        key = url_path + serialization.dumps(payload or {})
+        future: Future = Future()
+        with self._inflight_lock:
+            running = self._inflight.setdefault(key, future)
+        if running is not future:
+            return running.result()
+
+        try:
+            result = self._request(url_path, payload)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _request(self, url_path: str, payload: Any) -> Any:
+        response = self._shared_session.post(
+            self.base_url + url_path, json=payload or {}, timeout=self.timeout
+        )
+        self._handle_exception(response)
+        try:
+            return serialization.loads(response.content)
+        except ValueError:
+            return {"error": f"Could not parse JSON: {response.text}"}
 
 
 class HyperliquidClientManager:
@@ -15,6 +100,7 @@ class HyperliquidClientManager:
         wallet_address: str,
         private_key: str,
         account_address: Optional[str] = None,
+        local_account: Optional["LocalAccount"] = None,
     ) -> None:
         self.testnet = testnet
         self.wallet_address = wallet_address
@@ -25,34 +111,87 @@ class HyperliquidClientManager:
             if self.testnet
             else "https://api.hyperliquid.xyz"
         )
+        self._local_account = local_account
+        self._session = _build_session()
         self._info_client: Optional[Info] = None
-        self._exchange_client: Optional[Exchange] = None
+        self._exchange_client: Optional["Exchange"] = None
+        # Both clients fetch metadata when built, and Info starts a websocket
+        # thread, so concurrent first uses must construct only one of each.
+        self._info_lock = threading.Lock()
+        self._exchange_lock = threading.Lock()
 
     @property
     def info(self) -> Info:
         if self._info_client is None:
-            self._info_client = Info(base_url=self.base_url, skip_ws=False)
-        assert self._info_client is not None
+            with self._info_lock:
+                if self._info_client is None:
+                    self._info_client = _Info(
+                        base_url=self.base_url, skip_ws=False, session=self._session
+                    )
         return self._info_client
 
     @property
-    def exchange(self) -> Exchange:
+    def exchange(self) -> "Exchange":
         if self._exchange_client is None:
-            wallet = Account.from_key(self.private_key)  # pyrefly: ignore
-            self._exchange_client = Exchange(
-                wallet=wallet,
-                base_url=self.base_url,
-                account_address=self.account_address,
-            )
-        assert self._exchange_client is not None
+            with self._exchange_lock:
+                if self._exchange_client is None:
+                    self._exchange_client = self._build_exchange()
         return self._exchange_client
 
+    def _build_exchange(self) -> "Exchange":
+        # Signing pulls in eth_account, which takes longer to import than the
+        # rest of the server; read-only sessions never need it.
+        from eth_account import Account
+        from hyperliquid.exchange import Exchange
+
+        wallet = self._local_account
+        if wallet is None:
+            wallet = Account.from_key(self.private_key)  # pyrefly: ignore
+        exchange = Exchange(
+            wallet=wallet,
+            base_url=self.base_url,
+            account_address=self.account_address,
+        )
+        # Exchange and its internal Info each opened a session; swap in the
+        # pooled one and release theirs.
+        for api in (exchange, exchange.info):
+            api.session.close()
+            api.session = self._session
+        return exchange
+
+    async def get_info(self) -> Info:
+        """Return the Info client, building it off the event loop on first use."""
+        if self._info_client is not None:
+            return self._info_client
+        return await asyncio.to_thread(getattr, self, "info")
+
+    async def get_exchange(self) -> "Exchange":
+        """Return the Exchange client, building it off the event loop on first use."""
+        if self._exchange_client is not None:
+            return self._exchange_client
+        return await asyncio.to_thread(getattr, self, "exchange")
+
+    def close(self) -> None:
+        """Stop the Info websocket, if running, and release pooled connections."""
+        if self._info_client is not None and self._info_client.ws_manager is not None:
+            self._info_client.disconnect_websocket()
+        self._session.close()
+
     async def validate_connection(self) -> bool:
-        loop = asyncio.get_running_loop()
         try:
-            result = await loop.run_in_executor(None, self.info.all_mids)
+            result = await asyncio.wait_for(
+                self._fetch_all_mids(), timeout=VALIDATE_TIMEOUT
+            )
             return bool(result)
-        except Exception as exc:  # pragma: no cover - real network failures
+        except asyncio.TimeoutError as exc:
+            raise ConnectionError(
+                f"Timed out after {VALIDATE_TIMEOUT}s connecting to Hyperliquid API at {self.base_url}"
+            ) from exc
+        except Exception as exc:
             raise ConnectionError(
                 f"Failed to connect to Hyperliquid API at {self.base_url}: {exc}"
             ) from exc
+
+    async def _fetch_all_mids(self) -> Any:
+        info = await self.get_info()
+        return await asyncio.to_thread(info.all_mids)
@@ -1,21 +1,28 @@
 """Configuration helpers for the Hyperliquid MCP server."""
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Mapping, Optional
 
-from eth_account import Account
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
 
 
-def _require_env(key: str, message: str) -> str:
-    value = os.getenv(key)
+def _require_env(env: Mapping[str, str], key: str, message: str) -> str:
+    value = env.get(key)
     if not value:
         raise ValueError(message)
     return value
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes"})
+
+
 def _bool_from_env(value: str | None, *, default: bool = True) -> bool:
-    comparison = (value or ("true" if default else "false")).strip().lower()
-    return comparison in {"1", "true", "yes"}
+    if not value:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
 
 
 @dataclass(slots=True)
@@ -23,21 +30,42 @@ class HyperliquidConfig:
     private_key: str
     wallet_address: str
     testnet: bool = True
+    max_concurrency: int = 8
+    # Signer derived while loading the config, reused by the Exchange client.
+    local_account: Optional["LocalAccount"] = field(
+        default=None, repr=False, compare=False
+    )
 
     @classmethod
-    def from_env(cls) -> "HyperliquidConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "HyperliquidConfig":
+        if env is None:
+            env = os.environ
         private_key = cls._normalize_private_key(
             _require_env(
+                env,
                 "HYPERLIQUID_PRIVATE_KEY",
                 "HYPERLIQUID_PRIVATE_KEY environment variable is required. Please set it to your private key for signing transactions.",
             )
         )
-        wallet_address = os.getenv(
-            "HYPERLIQUID_WALLET_ADDRESS"
-        ) or cls._derive_wallet_address(private_key)
-        testnet = _bool_from_env(os.getenv("HYPERLIQUID_TESTNET"))
+        local_account = None
+        wallet_address = env.get("HYPERLIQUID_WALLET_ADDRESS")
+        if not wallet_address:
+            local_account = cls._derive_account(private_key)
+            wallet_address = local_account.address
+        testnet = _bool_from_env(env.get("HYPERLIQUID_TESTNET"))
+        raw_concurrency = env.get("HYPERLIQUID_MAX_CONCURRENCY")
+        try:
+            max_concurrency = int(raw_concurrency) if raw_concurrency else 8
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid HYPERLIQUID_MAX_CONCURRENCY: {raw_concurrency!r} is not an integer"
+            ) from exc
         return cls(
-            private_key=private_key, wallet_address=wallet_address, testnet=testnet
+            private_key=private_key,
+            wallet_address=wallet_address,
+            testnet=testnet,
+            max_concurrency=max_concurrency,
+            local_account=local_account,
         )
 
     @staticmethod
@@ -53,17 +81,27 @@ class HyperliquidConfig:
                 )
             )
         try:
-            int(key, 16)
+            # fromhex skips whitespace between byte pairs, so confirm the width too.
+            if len(bytes.fromhex(key[2:])) != 32:
+                raise ValueError("unexpected whitespace in key")
         except ValueError as exc:
             raise ValueError(
                 f"Invalid private key format: must be a valid hexadecimal string. Error: {exc}"
             ) from exc
         return key
 
+    @classmethod
+    def _derive_wallet_address(cls, private_key: str) -> str:
+        return cls._derive_account(private_key).address
+
     @staticmethod
-    def _derive_wallet_address(private_key: str) -> str:
+    def _derive_account(private_key: str) -> "LocalAccount":
+        # Imported here so configs with an explicit wallet address never load
+        # eth_account; the client manager defers it until an order is signed.
+        from eth_account import Account
+
         try:
-            return Account.from_key(private_key).address  # pyrefly: ignore
+            return Account.from_key(private_key)  # pyrefly: ignore
         except Exception as exc:  # pragma: no cover - SDK errors bubble up
             raise ValueError(
                 f"Failed to derive wallet address from private key: {exc}"
@@ -83,14 +121,25 @@ class HyperliquidConfig:
                 f"Invalid wallet address length: expected 42 characters, got {len(self.wallet_address)}"
             )
         try:
-            int(self.wallet_address, 16)
+            if len(bytes.fromhex(self.wallet_address[2:])) != 20:
+                raise ValueError("unexpected whitespace in address")
         except ValueError as exc:
             raise ValueError(
                 f"Invalid wallet address format: must be a valid hexadecimal string. Error: {exc}"
             ) from exc
+        if self.max_concurrency < 1:
+            raise ValueError(
+                f"Max concurrency must be at least 1, got {self.max_concurrency}"
+            )
 
 
+@functools.cache
 def load_config() -> HyperliquidConfig:
+    """Load and validate configuration from the environment.
+
+    The result is cached for the life of the process, so later changes to the
+    environment are ignored until ``load_config.cache_clear()`` is called.
+    """
     config = HyperliquidConfig.from_env()
     config.validate()
     return config
@@ -1,94 +1,194 @@
 """Decimal precision helpers."""
 
 import asyncio
-import re
-from decimal import Decimal, ROUND_DOWN
+import struct
+import time
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, Decimal
+from typing import Callable, Optional
 
-from cachetools import TTLCache
+from cachetools import LRUCache
 
 from hype_mcp.models import AssetMetadata
 
+_QUANTIZERS = {places: Decimal(1).scaleb(-places) for places in range(19)}
+
+
+def _quantizer(places: int) -> Decimal:
+    """Return ``10 ** -places`` as a Decimal, cached for common precisions."""
+    quantizer = _QUANTIZERS.get(places)
+    return quantizer if quantizer is not None else Decimal(10) ** -places
+
+
+@dataclass(frozen=True, slots=True)
+class _MetaIndex:
+    """Name-keyed views of the perp and spot metadata payloads."""
+
+    spot: dict[str, dict]
+    perp: dict[str, dict]
+
+    @classmethod
+    def build(cls, perp_meta: dict, spot_meta: dict) -> "_MetaIndex":
+        # setdefault keeps the first entry per name, matching a linear scan.
+        spot: dict[str, dict] = {}
+        for token in spot_meta.get("tokens", []):
+            spot.setdefault(token.get("name"), token)
+        perp: dict[str, dict] = {}
+        for asset in perp_meta.get("universe", []):
+            perp.setdefault(asset.get("name"), asset)
+        return cls(spot=spot, perp=perp)
+
 
 class DecimalPrecisionManager:
     CACHE_TTL = 3600
+    FORMAT_CACHE_SIZE = 4096
 
     def __init__(self, info_client) -> None:
         self.info_client = info_client
-        self._cache = TTLCache(maxsize=1000, ttl=self.CACHE_TTL)
+        # Per-symbol metadata, valid until the meta snapshot it came from expires.
+        self._cache: dict[str, AssetMetadata] = {}
+        self._cache_expiry = 0.0
+        # Name index over meta/spot_meta shared by every symbol lookup.
+        self._meta_index: Optional[_MetaIndex] = None
+        self._meta_lock = asyncio.Lock()
+        # Formatted outputs keyed by (symbol, float bits); cleared with _cache.
+        self._size_cache: LRUCache = LRUCache(maxsize=self.FORMAT_CACHE_SIZE)
+        self._price_cache: LRUCache = LRUCache(maxsize=self.FORMAT_CACHE_SIZE)
 
     async def get_asset_metadata(self, symbol: str) -> AssetMetadata:
-        cached = self._cache.get(symbol)
-        if cached:
+        cached = self._peek_metadata(symbol)
+        if cached is not None:
             return cached
-        loop = asyncio.get_running_loop()
-        perp_meta, spot_meta = await asyncio.gather(
-            loop.run_in_executor(None, self.info_client.meta),
-            loop.run_in_executor(None, self.info_client.spot_meta),
-        )
-        metadata = self._extract_metadata(symbol, perp_meta, spot_meta)
+        index = await self._get_meta()
+        metadata = self._extract_metadata(symbol, index)
         self._cache[symbol] = metadata
         return metadata
 
-    def _extract_metadata(
-        self, symbol: str, perp_meta: dict, spot_meta: dict
-    ) -> AssetMetadata:
-        asset_type = self._detect_asset_type(symbol, perp_meta, spot_meta)
-        if asset_type == "spot":
-            return self._extract_spot_metadata(symbol, spot_meta)
-        return self._extract_perp_metadata(symbol, perp_meta)
+    async def warm_all(self) -> None:
+        """Populate metadata for every listed asset from a single meta fetch."""
+        index = await self._get_meta()
+        for symbol in {*index.spot, *index.perp}:
+            self._cache[symbol] = self._extract_metadata(symbol, index)
 
-    def _detect_asset_type(self, symbol: str, perp_meta: dict, spot_meta: dict) -> str:
-        for token in spot_meta.get("tokens", []):
-            if token.get("name") == symbol:
-                return "spot"
-        for asset in perp_meta.get("universe", []):
-            if asset.get("name") == symbol:
-                return "perp"
-        raise ValueError(f"Asset '{symbol}' not found in Hyperliquid metadata")
+    def _peek_metadata(self, symbol: str) -> Optional[AssetMetadata]:
+        if time.monotonic() < self._cache_expiry:
+            return self._cache.get(symbol)
+        return None
 
-    def _extract_spot_metadata(self, symbol: str, spot_meta: dict) -> AssetMetadata:
-        for token in spot_meta.get("tokens", []):
-            if token.get("name") == symbol:
-                return AssetMetadata(
-                    symbol=symbol,
-                    asset_type="spot",
-                    sz_decimals=token.get("szDecimals", 0),
-                    max_decimals=8,
-                    max_leverage=None,
-                    spot_index=token.get("index"),
-                    token_id=token.get("tokenId"),
-                )
-        raise ValueError(f"Spot asset '{symbol}' not found in metadata")
-
-    def _extract_perp_metadata(self, symbol: str, meta_response: dict) -> AssetMetadata:
-        for asset in meta_response.get("universe", []):
-            if asset.get("name") == symbol:
-                return AssetMetadata(
-                    symbol=symbol,
-                    asset_type="perp",
-                    sz_decimals=asset.get("szDecimals", 0),
-                    max_decimals=6,
-                    max_leverage=asset.get("maxLeverage"),
-                )
-        raise ValueError(f"Perpetual asset '{symbol}' not found in metadata")
+    async def _get_meta(self) -> _MetaIndex:
+        if self._meta_index is not None and time.monotonic() < self._cache_expiry:
+            return self._meta_index
+        # Concurrent misses wait for a single fetch instead of each issuing one.
+        async with self._meta_lock:
+            if self._meta_index is not None and time.monotonic() < self._cache_expiry:
+                return self._meta_index
+            loop = asyncio.get_running_loop()
+            perp_meta, spot_meta = await asyncio.gather(
+                loop.run_in_executor(None, self.info_client.meta),
+                loop.run_in_executor(None, self.info_client.spot_meta),
+            )
+            self._meta_index = _MetaIndex.build(perp_meta, spot_meta)
+            self._cache.clear()
+            self._size_cache.clear()
+            self._price_cache.clear()
+            self._cache_expiry = time.monotonic() + self.CACHE_TTL
+            return self._meta_index
+
+    def _extract_metadata(self, symbol: str, index: _MetaIndex) -> AssetMetadata:
+        token = index.spot.get(symbol)
+        if token is not None:
+            return AssetMetadata(
+                symbol=symbol,
+                asset_type="spot",
+                sz_decimals=token.get("szDecimals", 0),
+                max_decimals=8,
+                max_leverage=None,
+                spot_index=token.get("index"),
+                token_id=token.get("tokenId"),
+            )
+        asset = index.perp.get(symbol)
+        if asset is not None:
+            return AssetMetadata(
+                symbol=symbol,
+                asset_type="perp",
+                sz_decimals=asset.get("szDecimals", 0),
+                max_decimals=6,
+                max_leverage=asset.get("maxLeverage"),
+            )
+        raise ValueError(f"Asset '{symbol}' not found in Hyperliquid metadata")
 
     async def format_size_for_api(self, symbol: str, size: float) -> str:
-        metadata = await self.get_asset_metadata(symbol)
-        quantizer = Decimal(10) ** -metadata.sz_decimals
+        metadata = self._peek_metadata(symbol) or await self.get_asset_metadata(symbol)
+        return self.format_size(metadata, size)
+
+    async def format_price_for_api(self, symbol: str, price: float) -> str:
+        metadata = self._peek_metadata(symbol) or await self.get_asset_metadata(symbol)
+        return self.format_price(metadata, price)
+
+    def format_size(self, metadata: AssetMetadata, size: float) -> str:
+        """Format ``size`` for an asset whose metadata the caller already holds."""
+        return self._memoized(self._size_cache, self._format_size, metadata, size)
+
+    def format_price(self, metadata: AssetMetadata, price: float) -> str:
+        """Format ``price`` for an asset whose metadata the caller already holds."""
+        return self._memoized(self._price_cache, self._format_price, metadata, price)
+
+    @staticmethod
+    def _memoized(
+        cache: LRUCache,
+        formatter: Callable[[AssetMetadata, float], str],
+        metadata: AssetMetadata,
+        value: float,
+    ) -> str:
+        # Packed bits keep 0.0 and -0.0 apart, which format differently.
+        key = (metadata.symbol, struct.pack("<d", value))
+        formatted = cache.get(key)
+        if formatted is None:
+            formatted = formatter(metadata, value)
+            cache[key] = formatted
+        return formatted
+
+    @staticmethod
+    def _format_size(metadata: AssetMetadata, size: float) -> str:
+        text = str(size)
+        whole, _, frac = text.partition(".")
+        if whole.isdigit() and (not frac or frac.isdigit()):
+            # Same truncation as the price fast path; Decimal.from_float would
+            # expose binary error (0.3 -> 0.2999...) and round sizes down.
+            frac = frac[: metadata.sz_decimals].rstrip("0")
+            return f"{whole}.{frac}" if frac else whole
+        quantizer = _quantizer(metadata.sz_decimals)
         rounded = Decimal(str(size)).quantize(quantizer, rounding=ROUND_DOWN)
         text = str(rounded)
         return text.rstrip("0").rstrip(".") if "." in text else text
 
-    async def format_price_for_api(self, symbol: str, price: float) -> str:
-        metadata = await self.get_asset_metadata(symbol)
+    @staticmethod
+    def _format_price(metadata: AssetMetadata, price: float) -> str:
+        if isinstance(price, float) and price.is_integer() and abs(price) < 2**53:
+            # Integer prices are always valid; below 2**53 int() matches the
+            # digits str() would print, so Decimal is not needed.
+            return str(int(price))
         max_price_decimals = metadata.max_decimals - metadata.sz_decimals
-        price_decimal = Decimal(str(price))
-        if price_decimal == price_decimal.to_integral_value():
-            return str(int(price_decimal))
-        quantizer = Decimal(10) ** -max_price_decimals
-        rounded = price_decimal.quantize(quantizer, rounding=ROUND_DOWN)
-        formatted = str(rounded).rstrip("0").rstrip(".")
-        sig_figs = len(re.sub(r"[^0-9]", "", formatted.lstrip("0").lstrip(".")))
+        text = str(price)
+        whole, _, frac = text.partition(".")
+        if max_price_decimals >= 0 and whole.isdigit() and (not frac or frac.isdigit()):
+            # Plain positive decimal text: truncating the fraction digits is
+            # ROUND_DOWN, so no Decimal arithmetic is needed.
+            if not frac.strip("0"):
+                return whole
+            frac = frac[:max_price_decimals].rstrip("0")
+            formatted = f"{whole}.{frac}" if frac else whole
+            sig_figs = len(frac) if whole == "0" else len(whole.lstrip("0")) + len(frac)
+        else:
+            # Exponent notation, signs, or non-finite values.
+            price_decimal = Decimal(text)
+            if price_decimal == price_decimal.to_integral_value():
+                return str(int(price_decimal))
+            quantizer = _quantizer(max_price_decimals)
+            formatted = str(price_decimal.quantize(quantizer, rounding=ROUND_DOWN))
+            if "." in formatted:
+                formatted = formatted.rstrip("0").rstrip(".")
+            sig_figs = sum(c.isdigit() for c in formatted.lstrip("0").lstrip("."))
         if sig_figs > 5:
             raise ValueError(
                 f"Price {price} has {sig_figs} significant figures, maximum is 5"
@@ -24,17 +24,17 @@ class HyperliquidMCPError(Exception):
         self.message = message
         self.error_type = error_type
         self.details = details or {}
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert error to dictionary format for API responses."""
-        result: dict[str, Any] = {
+        self._payload: dict[str, Any] = {
             "success": False,
-            "error": self.message,
-            "error_type": self.error_type,
+            "error": message,
+            "error_type": error_type,
         }
         if self.details:
-            result["details"] = self.details
-        return result
+            self._payload["details"] = self.details
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert error to dictionary format for API responses."""
+        return dict(self._payload)
 
 
 class ValidationError(HyperliquidMCPError):
@@ -231,8 +231,9 @@ def format_error_response(error: Exception) -> dict[str, Any]:
 
     # Handle Pydantic validation errors
     if hasattr(error, "errors"):
-        # Pydantic ValidationError
-        errors = error.errors()
+        # Pydantic ValidationError; ctx can hold the raised exception, which
+        # is not JSON-serializable, and the message already describes it.
+        errors = error.errors(include_context=False)
         if errors:
             first_error = errors[0]
             field = ".".join(str(loc) for loc in first_error.get("loc", []))
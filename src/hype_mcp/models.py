@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Literal, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetMetadata:
     """Metadata for a trading asset."""
 
@@ -17,7 +17,7 @@ class AssetMetadata:
     token_id: Optional[str] = None  # Only for spot assets
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     """Internal representation of an order."""
 
@@ -31,7 +31,7 @@ class OrderRequest:
     reduce_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResponse:
     """Standardized response format for all tools."""
 
@@ -0,0 +1,28 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document, preferring orjson's C parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as compact JSON text, preferring orjson's C encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects integers wider than 64 bits; json handles them.
+            pass
+    # Match orjson's UTF-8 output instead of \uXXXX-escaping non-ASCII text.
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
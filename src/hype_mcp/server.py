@@ -1,18 +1,23 @@
 """Main MCP server implementation."""
 
-import json
+import asyncio
+import sys
+import time
 from functools import partial
-from typing import Any
+from typing import Any, Optional
 
+from cachetools import LRUCache
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
+from pydantic import BaseModel
 
 from .asset_router import AssetRouter
 from .client_manager import HyperliquidClientManager
 from .config import HyperliquidConfig
 from .decimal_manager import DecimalPrecisionManager
-from .errors import format_error_response
+from .errors import ValidationError, format_error_response
+from .serialization import dumps
 from .tools import (
     cancel_all_orders,
     cancel_order,
@@ -25,11 +30,437 @@ from .tools import (
     place_spot_order,
     transfer_wallet_funds,
 )
+from .validation import (
+    ClosePositionParams,
+    MarketDataParams,
+    PerpOrderParams,
+    SpotOrderParams,
+)
+
+# Property schemas shared by several tools.
+_USER_ADDRESS_SCHEMA: dict[str, Any] = {
+    "type": "string",
+    "description": (
+        "Wallet address to query. If not provided, defaults to "
+        "the configured wallet address. Must be a valid Ethereum "
+        "address starting with 0x."
+    ),
+}
+_LIMIT_SCHEMA: dict[str, Any] = {
+    "type": "integer",
+    "minimum": 1,
+    "description": (
+        "Optional page size. When set, the response includes "
+        "'next_cursor' for fetching the following page."
+    ),
+}
+_CURSOR_SCHEMA: dict[str, Any] = {
+    "type": "integer",
+    "minimum": 0,
+    "description": "Optional 'next_cursor' value from a previous page.",
+}
+_PRICE_SCHEMA: dict[str, Any] = {
+    "type": "number",
+    "description": (
+        "Limit price for the order. Required for limit orders, ignored for "
+        "market orders. Will be automatically formatted to match precision rules."
+    ),
+}
+_ORDER_TYPE_SCHEMA: dict[str, Any] = {
+    "type": "string",
+    "enum": ["market", "limit"],
+    "description": (
+        "Type of order - 'market' for immediate execution at current market "
+        "price, 'limit' to execute only at specified price or better. "
+        "Defaults to 'market'."
+    ),
+}
+
+# Tool schemas are constant, so build them once and hand the same list to every
+# list_tools call; the SDK only reads it when building the response.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_account_state",
+        description=(
+            "Get the current state of a user's account including positions, "
+            "balances, and margin. Returns comprehensive account information "
+            "including open positions, available balances, margin usage, and "
+            "withdrawal limits."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_address": _USER_ADDRESS_SCHEMA,
+            },
+        },
+    ),
+    Tool(
+        name="get_open_orders",
+        description=(
+            "Get all open orders for a user. Returns all currently open orders "
+            "across all assets with full details including order ID, symbol, "
+            "side, size, price, and timestamp."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_address": _USER_ADDRESS_SCHEMA,
+                "limit": _LIMIT_SCHEMA,
+                "cursor": _CURSOR_SCHEMA,
+            },
+        },
+    ),
+    Tool(
+        name="get_market_data",
+        description=(
+            "Get current market data for an asset including price, volume, "
+            "and funding rate. Returns real-time market information including "
+            "current prices, 24-hour volume, funding rates (for perpetuals), "
+            "and open interest."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Asset symbol to query (e.g., 'BTC', 'ETH', 'PURR', 'SOL'). "
+                        "Symbol is case-sensitive and must match exactly."
+                    ),
+                },
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="get_all_assets",
+        description=(
+            "Get metadata for all available assets on Hyperliquid. Returns "
+            "comprehensive metadata for all tradeable assets including both "
+            "perpetual contracts and spot assets. Includes important trading "
+            "parameters like decimal precision and maximum leverage."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": _LIMIT_SCHEMA,
+                "cursor": _CURSOR_SCHEMA,
+            },
+        },
+    ),
+    Tool(
+        name="place_spot_order",
+        description=(
+            "Place a spot market order. Decimal precision is handled automatically. "
+            "You can place either market orders (immediate execution) or limit orders "
+            "(execute at specific price). This tool automatically formats sizes and "
+            "prices according to Hyperliquid's decimal precision requirements."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Spot asset symbol (e.g., 'PURR', 'HYPE'). Must be a valid "
+                        "spot asset available on Hyperliquid."
+                    ),
+                },
+                "side": {
+                    "type": "string",
+                    "enum": ["buy", "sell"],
+                    "description": (
+                        "Order side - 'buy' to purchase the asset, 'sell' to sell the asset"
+                    ),
+                },
+                "size": {
+                    "type": "number",
+                    "description": (
+                        "Quantity to trade in human-readable format (e.g., 100.5, 1000). "
+                        "Will be automatically formatted to match asset's decimal precision."
+                    ),
+                },
+                "price": _PRICE_SCHEMA,
+                "order_type": _ORDER_TYPE_SCHEMA,
+            },
+            "required": ["symbol", "side", "size"],
+        },
+    ),
+    Tool(
+        name="place_perp_order",
+        description=(
+            "Place a perpetual futures order. Decimal precision is handled automatically. "
+            "You can place either market orders (immediate execution) or limit orders "
+            "(execute at specific price). Supports leverage trading and reduce-only orders "
+            "for position management. This tool automatically formats sizes and prices "
+            "according to Hyperliquid's decimal precision requirements."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Perpetual contract symbol (e.g., 'BTC', 'ETH', 'SOL'). Must be a "
+                        "valid perpetual contract available on Hyperliquid."
+                    ),
+                },
+                "side": {
+                    "type": "string",
+                    "enum": ["buy", "sell"],
+                    "description": (
+                        "Order side - 'buy' to go long (bet on price increase), 'sell' to "
+                        "go short (bet on price decrease)"
+                    ),
+                },
+                "size": {
+                    "type": "number",
+                    "description": (
+                        "Position size in human-readable format (e.g., 0.5 for 0.5 BTC, "
+                        "10 for 10 ETH). Will be automatically formatted to match asset's "
+                        "decimal precision."
+                    ),
+                },
+                "leverage": {
+                    "type": "integer",
+                    "description": (
+                        "Leverage multiplier (e.g., 5 for 5x leverage, 10 for 10x leverage). "
+                        "Must be within the asset's maximum allowed leverage. Higher leverage "
+                        "amplifies both gains and losses."
+                    ),
+                },
+                "price": _PRICE_SCHEMA,
+                "order_type": _ORDER_TYPE_SCHEMA,
+                "reduce_only": {
+                    "type": "boolean",
+                    "description": (
+                        "If true, order can only reduce an existing position and cannot "
+                        "increase it or open a new position. Useful for taking profits or "
+                        "cutting losses. Defaults to false."
+                    ),
+                },
+            },
+            "required": ["symbol", "side", "size", "leverage"],
+        },
+    ),
+    Tool(
+        name="cancel_order",
+        description=(
+            "Cancel an open order. You need to provide the asset symbol and the order ID. "
+            "The order ID can be obtained from the get_open_orders tool."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Asset symbol for the order (e.g., 'BTC', 'ETH', 'PURR'). Must match "
+                        "the symbol of the order you want to cancel."
+                    ),
+                },
+                "order_id": {
+                    "type": "integer",
+                    "description": (
+                        "Order ID to cancel. This is the unique identifier returned when "
+                        "the order was placed or can be found using get_open_orders."
+                    ),
+                },
+            },
+            "required": ["symbol", "order_id"],
+        },
+    ),
+    Tool(
+        name="cancel_all_orders",
+        description=(
+            "Cancel all open orders, optionally filtered by symbol. If no symbol is provided, "
+            "all open orders across all assets will be cancelled. Returns the count of "
+            "cancelled orders."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Optional asset symbol to filter cancellations (e.g., 'BTC', 'ETH', 'PURR'). "
+                        "If provided, only orders for this symbol will be cancelled. If not provided, "
+                        "all orders across all assets will be cancelled."
+                    ),
+                },
+            },
+        },
+    ),
+    Tool(
+        name="close_position",
+        description=(
+            "Close a perpetual position (full or partial). Automatically queries your current "
+            "position to determine the correct side and size. You can close the entire position "
+            "or specify a partial size to close."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Perpetual contract symbol (e.g., 'BTC', 'ETH', 'SOL'). Must be a "
+                        "valid perpetual contract with an open position."
+                    ),
+                },
+                "size": {
+                    "type": "number",
+                    "description": (
+                        "Optional amount to close. If not provided, closes the entire position. "
+                        "If provided, must not exceed the current position size. Will be "
+                        "automatically formatted to match asset's decimal precision."
+                    ),
+                },
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="transfer_wallet_funds",
+        description=(
+            "Transfer USDC between your perp and spot wallets using Hyperliquid's usdClassTransfer "
+            "action. Useful for moving collateral into spot for token purchases or back into perp "
+            "margin."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "amount": {
+                    "type": "number",
+                    "description": (
+                        "Amount of USDC to transfer. Must be greater than zero and is denominated "
+                        "in whole USDC (e.g., 25.5)."
+                    ),
+                },
+                "direction": {
+                    "type": "string",
+                    "enum": ["perp_to_spot", "spot_to_perp"],
+                    "description": (
+                        "Direction of the transfer. Use 'perp_to_spot' to move funds into the "
+                        "spot wallet or 'spot_to_perp' to move them back into the perp wallet."
+                    ),
+                },
+            },
+            "required": ["amount", "direction"],
+        },
+    ),
+    Tool(
+        name="batch_call",
+        description=(
+            "Run several tool calls concurrently and return their results in order. Useful for "
+            "fetching market data or account information for multiple symbols at once. Each "
+            "result has the same shape as calling the tool directly, and a failing call does "
+            "not affect the others."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run. batch_call itself cannot be nested.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call (e.g., 'get_market_data')",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool, as for a direct call",
+                            },
+                        },
+                        "required": ["name"],
+                    },
+                },
+            },
+            "required": ["calls"],
+        },
+    ),
+]
+
+# Missing-argument responses are identical per field, so encode them once.
+_MISSING_PARAM_RESPONSES: dict[str, str] = {
+    field: dumps(
+        ValidationError(f"{field} parameter is required", field=field).to_dict()
+    )
+    for field in (
+        "symbol",
+        "side",
+        "size",
+        "leverage",
+        "order_id",
+        "amount",
+        "direction",
+        "calls",
+    )
+}
+
+_INVALID_BATCH_ITEM = dumps(
+    ValidationError(
+        "Each batch call must be an object with a string 'name'", field="calls"
+    ).to_dict()
+)
+
+_make_text = TextContent.model_construct
+
+# Read-only tools whose encoded results are reused briefly, with TTLs in seconds.
+_RESULT_CACHE_TTLS = {
+    "get_all_assets": 30.0,
+    "get_market_data": 0.25,
+    "get_account_state": 0.25,
+}
+_RESULT_CACHE_SIZE = 256
+
+# Tools that receive the lazily created helpers as keyword arguments.
+_DECIMAL_MANAGER_TOOLS = frozenset(
+    {"place_spot_order", "place_perp_order", "close_position"}
+)
+_ASSET_ROUTER_TOOLS = frozenset({"get_market_data", "place_spot_order"})
+
+# Parameter models checked before the helpers above are awaited, so malformed
+# input is rejected without touching the API. Handlers validate again.
+_PARAM_MODELS: dict[str, type[BaseModel]] = {
+    "get_market_data": MarketDataParams,
+    "place_spot_order": SpotOrderParams,
+    "place_perp_order": PerpOrderParams,
+    "close_position": ClosePositionParams,
+}
+
+# Read-only tools whose identical concurrent calls share one request.
+_SINGLE_FLIGHT_TOOLS = frozenset(
+    {"get_all_assets", "get_market_data", "get_account_state", "get_open_orders"}
+)
 
 
 class HyperliquidMCPServer:
     """Main MCP server class for Hyperliquid integration."""
 
+    __slots__ = (
+        "_helpers_lock",
+        "_inflight",
+        "_init_options",
+        "_io_sem",
+        "_required_arguments",
+        "_result_cache",
+        "_tool_arguments",
+        "_tool_handlers",
+        "_write_generation",
+        "asset_router",
+        "client_manager",
+        "config",
+        "decimal_manager",
+        "mcp",
+        "private_key",
+        "testnet",
+        "wallet_address",
+    )
+
     def __init__(self, config: HyperliquidConfig):
         """
         Initialize the Hyperliquid MCP server.
@@ -46,416 +477,272 @@ class HyperliquidMCPServer:
             testnet=self.testnet,
             wallet_address=self.wallet_address,
             private_key=self.private_key,
+            local_account=config.local_account,
         )
 
-        self.asset_router = AssetRouter(info_client=self.client_manager.info)
-        self.decimal_manager = DecimalPrecisionManager(
-            info_client=self.client_manager.info
-        )
+        # Building the SDK Info client fetches metadata, so these helpers are
+        # created on first use rather than before the transport is up.
+        self.asset_router: Optional[AssetRouter] = None
+        self.decimal_manager: Optional[DecimalPrecisionManager] = None
+        self._helpers_lock = asyncio.Lock()
+
+        # (tool name, argument repr) -> (expires_at, encoded result)
+        self._result_cache: LRUCache = LRUCache(maxsize=_RESULT_CACHE_SIZE)
+        # (tool name, argument repr) -> running call shared by identical reads
+        self._inflight: dict[tuple[str, str], asyncio.Future[str]] = {}
+        # Bumped by every write so reads that overlapped one are not cached.
+        self._write_generation = 0
+        # Caps concurrent handler calls so batches cannot flood the API.
+        self._io_sem = asyncio.Semaphore(config.max_concurrency)
 
         self.mcp = Server("hyperliquid-mcp-server")
         self._init_tool_handlers()
         self._register_tools()
+        # Built after registration so the advertised capabilities include tools.
+        self._init_options = self.mcp.create_initialization_options()
 
     def _init_tool_handlers(self) -> None:
         self._tool_handlers = {
             "get_account_state": partial(get_account_state, self.client_manager),
             "get_open_orders": partial(get_open_orders, self.client_manager),
-            "get_market_data": partial(
-                get_market_data,
-                self.client_manager,
-                asset_router=self.asset_router,
-            ),
+            "get_market_data": partial(get_market_data, self.client_manager),
             "get_all_assets": partial(get_all_assets, self.client_manager),
-            "place_spot_order": partial(
-                place_spot_order,
-                self.client_manager,
-                self.decimal_manager,
-                self.asset_router,
-            ),
-            "place_perp_order": partial(
-                place_perp_order,
-                self.client_manager,
-                self.decimal_manager,
-            ),
+            "place_spot_order": partial(place_spot_order, self.client_manager),
+            "place_perp_order": partial(place_perp_order, self.client_manager),
             "cancel_order": partial(cancel_order, self.client_manager),
             "cancel_all_orders": partial(cancel_all_orders, self.client_manager),
-            "close_position": partial(
-                close_position,
-                self.client_manager,
-                self.decimal_manager,
-            ),
+            "close_position": partial(close_position, self.client_manager),
             "transfer_wallet_funds": partial(
                 transfer_wallet_funds,
                 self.client_manager,
             ),
         }
+        # Frozensets so call_tool can pick out accepted keys with one intersection.
         self._tool_arguments = {
-            "get_account_state": ["user_address"],
-            "get_open_orders": ["user_address"],
-            "get_market_data": ["symbol"],
-            "get_all_assets": [],
-            "place_spot_order": ["symbol", "side", "size", "price", "order_type"],
-            "place_perp_order": [
-                "symbol",
-                "side",
-                "size",
-                "leverage",
-                "price",
-                "order_type",
-                "reduce_only",
-            ],
-            "cancel_order": ["symbol", "order_id"],
-            "cancel_all_orders": ["symbol"],
-            "close_position": ["symbol", "size"],
-            "transfer_wallet_funds": ["amount", "direction"],
+            "get_account_state": frozenset({"user_address"}),
+            "get_open_orders": frozenset({"user_address", "limit", "cursor"}),
+            "get_market_data": frozenset({"symbol"}),
+            "get_all_assets": frozenset({"limit", "cursor"}),
+            "place_spot_order": frozenset(
+                {"symbol", "side", "size", "price", "order_type"}
+            ),
+            "place_perp_order": frozenset(
+                {
+                    "symbol",
+                    "side",
+                    "size",
+                    "leverage",
+                    "price",
+                    "order_type",
+                    "reduce_only",
+                }
+            ),
+            "cancel_order": frozenset({"symbol", "order_id"}),
+            "cancel_all_orders": frozenset({"symbol"}),
+            "close_position": frozenset({"symbol", "size"}),
+            "transfer_wallet_funds": frozenset({"amount", "direction"}),
+        }
+        # Mirrors the "required" lists in _TOOLS so missing fields fail fast.
+        self._required_arguments = {
+            "get_market_data": frozenset({"symbol"}),
+            "place_spot_order": frozenset({"symbol", "side", "size"}),
+            "place_perp_order": frozenset({"symbol", "side", "size", "leverage"}),
+            "cancel_order": frozenset({"symbol", "order_id"}),
+            "close_position": frozenset({"symbol"}),
+            "transfer_wallet_funds": frozenset({"amount", "direction"}),
         }
 
     def _register_tools(self):
         """Register all MCP tools."""
+        self.mcp.list_tools()(self._handle_list_tools)
+        self.mcp.call_tool()(self._handle_call_tool)
 
-        @self.mcp.list_tools()
-        async def list_tools() -> list[Tool]:
-            """List all available tools."""
-            return [
-                Tool(
-                    name="get_account_state",
-                    description=(
-                        "Get the current state of a user's account including positions, "
-                        "balances, and margin. Returns comprehensive account information "
-                        "including open positions, available balances, margin usage, and "
-                        "withdrawal limits."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "user_address": {
-                                "type": "string",
-                                "description": (
-                                    "Wallet address to query. If not provided, defaults to "
-                                    "the configured wallet address. Must be a valid Ethereum "
-                                    "address starting with 0x."
-                                ),
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="get_open_orders",
-                    description=(
-                        "Get all open orders for a user. Returns all currently open orders "
-                        "across all assets with full details including order ID, symbol, "
-                        "side, size, price, and timestamp."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "user_address": {
-                                "type": "string",
-                                "description": (
-                                    "Wallet address to query. If not provided, defaults to "
-                                    "the configured wallet address. Must be a valid Ethereum "
-                                    "address starting with 0x."
-                                ),
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="get_market_data",
-                    description=(
-                        "Get current market data for an asset including price, volume, "
-                        "and funding rate. Returns real-time market information including "
-                        "current prices, 24-hour volume, funding rates (for perpetuals), "
-                        "and open interest."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Asset symbol to query (e.g., 'BTC', 'ETH', 'PURR', 'SOL'). "
-                                    "Symbol is case-sensitive and must match exactly."
-                                ),
-                            },
-                        },
-                        "required": ["symbol"],
-                    },
-                ),
-                Tool(
-                    name="get_all_assets",
-                    description=(
-                        "Get metadata for all available assets on Hyperliquid. Returns "
-                        "comprehensive metadata for all tradeable assets including both "
-                        "perpetual contracts and spot assets. Includes important trading "
-                        "parameters like decimal precision and maximum leverage."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                    },
-                ),
-                Tool(
-                    name="place_spot_order",
-                    description=(
-                        "Place a spot market order. Decimal precision is handled automatically. "
-                        "You can place either market orders (immediate execution) or limit orders "
-                        "(execute at specific price). This tool automatically formats sizes and "
-                        "prices according to Hyperliquid's decimal precision requirements."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Spot asset symbol (e.g., 'PURR', 'HYPE'). Must be a valid "
-                                    "spot asset available on Hyperliquid."
-                                ),
-                            },
-                            "side": {
-                                "type": "string",
-                                "enum": ["buy", "sell"],
-                                "description": (
-                                    "Order side - 'buy' to purchase the asset, 'sell' to sell the asset"
-                                ),
-                            },
-                            "size": {
-                                "type": "number",
-                                "description": (
-                                    "Quantity to trade in human-readable format (e.g., 100.5, 1000). "
-                                    "Will be automatically formatted to match asset's decimal precision."
-                                ),
-                            },
-                            "price": {
-                                "type": "number",
-                                "description": (
-                                    "Limit price for the order. Required for limit orders, ignored for "
-                                    "market orders. Will be automatically formatted to match precision rules."
-                                ),
-                            },
-                            "order_type": {
-                                "type": "string",
-                                "enum": ["market", "limit"],
-                                "description": (
-                                    "Type of order - 'market' for immediate execution at current market "
-                                    "price, 'limit' to execute only at specified price or better. "
-                                    "Defaults to 'market'."
-                                ),
-                            },
-                        },
-                        "required": ["symbol", "side", "size"],
-                    },
-                ),
-                Tool(
-                    name="place_perp_order",
-                    description=(
-                        "Place a perpetual futures order. Decimal precision is handled automatically. "
-                        "You can place either market orders (immediate execution) or limit orders "
-                        "(execute at specific price). Supports leverage trading and reduce-only orders "
-                        "for position management. This tool automatically formats sizes and prices "
-                        "according to Hyperliquid's decimal precision requirements."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Perpetual contract symbol (e.g., 'BTC', 'ETH', 'SOL'). Must be a "
-                                    "valid perpetual contract available on Hyperliquid."
-                                ),
-                            },
-                            "side": {
-                                "type": "string",
-                                "enum": ["buy", "sell"],
-                                "description": (
-                                    "Order side - 'buy' to go long (bet on price increase), 'sell' to "
-                                    "go short (bet on price decrease)"
-                                ),
-                            },
-                            "size": {
-                                "type": "number",
-                                "description": (
-                                    "Position size in human-readable format (e.g., 0.5 for 0.5 BTC, "
-                                    "10 for 10 ETH). Will be automatically formatted to match asset's "
-                                    "decimal precision."
-                                ),
-                            },
-                            "leverage": {
-                                "type": "integer",
-                                "description": (
-                                    "Leverage multiplier (e.g., 5 for 5x leverage, 10 for 10x leverage). "
-                                    "Must be within the asset's maximum allowed leverage. Higher leverage "
-                                    "amplifies both gains and losses."
-                                ),
-                            },
-                            "price": {
-                                "type": "number",
-                                "description": (
-                                    "Limit price for the order. Required for limit orders, ignored for "
-                                    "market orders. Will be automatically formatted to match precision rules."
-                                ),
-                            },
-                            "order_type": {
-                                "type": "string",
-                                "enum": ["market", "limit"],
-                                "description": (
-                                    "Type of order - 'market' for immediate execution at current market "
-                                    "price, 'limit' to execute only at specified price or better. "
-                                    "Defaults to 'market'."
-                                ),
-                            },
-                            "reduce_only": {
-                                "type": "boolean",
-                                "description": (
-                                    "If true, order can only reduce an existing position and cannot "
-                                    "increase it or open a new position. Useful for taking profits or "
-                                    "cutting losses. Defaults to false."
-                                ),
-                            },
-                        },
-                        "required": ["symbol", "side", "size", "leverage"],
-                    },
-                ),
-                Tool(
-                    name="cancel_order",
-                    description=(
-                        "Cancel an open order. You need to provide the asset symbol and the order ID. "
-                        "The order ID can be obtained from the get_open_orders tool."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Asset symbol for the order (e.g., 'BTC', 'ETH', 'PURR'). Must match "
-                                    "the symbol of the order you want to cancel."
-                                ),
-                            },
-                            "order_id": {
-                                "type": "integer",
-                                "description": (
-                                    "Order ID to cancel. This is the unique identifier returned when "
-                                    "the order was placed or can be found using get_open_orders."
-                                ),
-                            },
-                        },
-                        "required": ["symbol", "order_id"],
-                    },
-                ),
-                Tool(
-                    name="cancel_all_orders",
-                    description=(
-                        "Cancel all open orders, optionally filtered by symbol. If no symbol is provided, "
-                        "all open orders across all assets will be cancelled. Returns the count of "
-                        "cancelled orders."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Optional asset symbol to filter cancellations (e.g., 'BTC', 'ETH', 'PURR'). "
-                                    "If provided, only orders for this symbol will be cancelled. If not provided, "
-                                    "all orders across all assets will be cancelled."
-                                ),
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="close_position",
-                    description=(
-                        "Close a perpetual position (full or partial). Automatically queries your current "
-                        "position to determine the correct side and size. You can close the entire position "
-                        "or specify a partial size to close."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": (
-                                    "Perpetual contract symbol (e.g., 'BTC', 'ETH', 'SOL'). Must be a "
-                                    "valid perpetual contract with an open position."
-                                ),
-                            },
-                            "size": {
-                                "type": "number",
-                                "description": (
-                                    "Optional amount to close. If not provided, closes the entire position. "
-                                    "If provided, must not exceed the current position size. Will be "
-                                    "automatically formatted to match asset's decimal precision."
-                                ),
-                            },
-                        },
-                        "required": ["symbol"],
-                    },
-                ),
-                Tool(
-                    name="transfer_wallet_funds",
-                    description=(
-                        "Transfer USDC between your perp and spot wallets using Hyperliquid's usdClassTransfer "
-                        "action. Useful for moving collateral into spot for token purchases or back into perp "
-                        "margin."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "amount": {
-                                "type": "number",
-                                "description": (
-                                    "Amount of USDC to transfer. Must be greater than zero and is denominated "
-                                    "in whole USDC (e.g., 25.5)."
-                                ),
-                            },
-                            "direction": {
-                                "type": "string",
-                                "enum": ["perp_to_spot", "spot_to_perp"],
-                                "description": (
-                                    "Direction of the transfer. Use 'perp_to_spot' to move funds into the "
-                                    "spot wallet or 'spot_to_perp' to move them back into the perp wallet."
-                                ),
-                            },
-                        },
-                        "required": ["amount", "direction"],
-                    },
-                ),
-            ]
-
-        @self.mcp.call_tool()
-        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-            handler = self._tool_handlers.get(name)
-            if handler is None:
-                error = {"success": False, "error": f"Unknown tool: {name}"}
-                return [TextContent(type="text", text=json.dumps(error, indent=2))]
-
-            arguments = arguments or {}
-            tool_args = {
-                key: arguments[key]
-                for key in self._tool_arguments.get(name, [])
-                if key in arguments
-            }
-
-            try:
+    async def _handle_list_tools(self) -> list[Tool]:
+        """List all available tools."""
+        return _TOOLS
+
+    async def _handle_call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        if name == "batch_call":
+            text = await self._dispatch_batch((arguments or {}).get("calls"))
+        else:
+            text = await self._dispatch_one(name, arguments)
+        # The text is always a str we encoded, so skip pydantic validation.
+        return [_make_text(type="text", text=text)]
+
+    async def _dispatch_one(
+        self, name: str, arguments: Optional[dict[str, Any]]
+    ) -> str:
+        """Run a single tool call and return its JSON-encoded result."""
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return dumps({"success": False, "error": f"Unknown tool: {name}"})
+
+        arguments = arguments or {}
+        required = self._required_arguments.get(name)
+        if required is not None:
+            missing = required.difference(arguments)
+            if missing:
+                # min() keeps the reported field stable across hash seeds.
+                return _MISSING_PARAM_RESPONSES[min(missing)]
+
+        accepted = arguments.keys() & self._tool_arguments[name]
+        tool_args = {key: arguments[key] for key in accepted}
+
+        # Argument names are unique, so sorting never compares values and the
+        # repr is a stable key for both the result cache and in-flight calls.
+        call_key = (name, repr(sorted(tool_args.items())))
+        if name in _RESULT_CACHE_TTLS:
+            cached = self._result_cache.get(call_key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+
+        if name not in _SINGLE_FLIGHT_TOOLS:
+            return await self._run_handler(name, handler, tool_args, call_key)
+
+        # Identical concurrent reads share one call.
+        flight = self._inflight.get(call_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._run_handler(name, handler, tool_args, call_key)
+            )
+            self._inflight[call_key] = flight
+            flight.add_done_callback(partial(self._end_flight, call_key))
+        # Shielded so one caller going away does not cancel the others' result.
+        return await asyncio.shield(flight)
+
+    def _end_flight(
+        self, call_key: tuple[str, str], flight: "asyncio.Future[str]"
+    ) -> None:
+        # A write may already have replaced this flight with a newer one.
+        if self._inflight.get(call_key) is flight:
+            del self._inflight[call_key]
+
+    async def _run_handler(
+        self,
+        name: str,
+        handler: Any,
+        tool_args: dict[str, Any],
+        call_key: tuple[str, str],
+    ) -> str:
+        """Call a tool handler and return its encoded result or error."""
+        is_write = name not in _SINGLE_FLIGHT_TOOLS
+        generation = self._write_generation
+        try:
+            model = _PARAM_MODELS.get(name)
+            if model is not None:
+                model.model_validate(tool_args)
+            if name in _DECIMAL_MANAGER_TOOLS:
+                tool_args["decimal_manager"] = await self._get_decimal_manager()
+            if name in _ASSET_ROUTER_TOOLS:
+                tool_args["asset_router"] = await self._get_asset_router()
+            async with self._io_sem:
                 result = await handler(**tool_args)
-            except Exception as exc:  # pragma: no cover - delegated to formatter
-                error_result = format_error_response(exc)
-                return [
-                    TextContent(type="text", text=json.dumps(error_result, indent=2))
-                ]
+        except Exception as exc:  # pragma: no cover - delegated to formatter
+            return dumps(format_error_response(exc))
+        finally:
+            # Even a failed write may have reached the exchange, so always drop
+            # account state and keep reads already under way from caching it.
+            if is_write:
+                self._invalidate_account_state()
+
+        text = dumps(result)
+        ttl = _RESULT_CACHE_TTLS.get(name)
+        if (
+            ttl is not None
+            and result.get("success")
+            and generation == self._write_generation
+        ):
+            self._result_cache[call_key] = (time.monotonic() + ttl, text)
+        return text
+
+    def _invalidate_account_state(self) -> None:
+        """Forget cached and in-flight account state after a write."""
+        self._write_generation += 1
+        for key in [k for k in self._result_cache if k[0] == "get_account_state"]:
+            del self._result_cache[key]
+        # Running reads still answer their current waiters; later calls start
+        # a fresh request instead of joining one that predates the write.
+        for key in [k for k in self._inflight if k[0] == "get_account_state"]:
+            del self._inflight[key]
+
+    async def _dispatch_batch(self, calls: Any) -> str:
+        """Run tool calls concurrently and return their results as one JSON array."""
+        if calls is None:
+            return _MISSING_PARAM_RESPONSES["calls"]
+        if not isinstance(calls, list):
+            return _INVALID_BATCH_ITEM
+
+        async def run(call: Any) -> str:
+            if not isinstance(call, dict) or not isinstance(call.get("name"), str):
+                return _INVALID_BATCH_ITEM
+            return await self._dispatch_one(call["name"], call.get("arguments"))
+
+        texts = await asyncio.gather(*(run(call) for call in calls))
+        # Each item is already encoded, so splice them instead of re-encoding.
+        return '{"success":true,"data":[' + ",".join(texts) + "]}"
+
+    async def _get_decimal_manager(self) -> DecimalPrecisionManager:
+        """Create the precision manager on first use."""
+        if self.decimal_manager is None:
+            async with self._helpers_lock:
+                if self.decimal_manager is None:
+                    info = await self.client_manager.get_info()
+                    self.decimal_manager = DecimalPrecisionManager(info_client=info)
+        return self.decimal_manager
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    async def _get_asset_router(self) -> AssetRouter:
+        """Create the spot asset router on first use."""
+        if self.asset_router is None:
+            async with self._helpers_lock:
+                if self.asset_router is None:
+                    info = await self.client_manager.get_info()
+                    self.asset_router = AssetRouter(info_client=info)
+        return self.asset_router
 
-    async def run(self):
+    async def _warm_caches(self) -> None:
+        """Load spot routing tables and asset metadata without delaying startup."""
+
+        async def warm_router() -> None:
+            await (await self._get_asset_router()).ensure_ready()
+
+        async def warm_decimals() -> None:
+            await (await self._get_decimal_manager()).warm_all()
+
+        # Failures are left to the first tool call that needs the data, which
+        # retries the fetch and reports the error to the client.
+        results = await asyncio.gather(
+            warm_router(), warm_decimals(), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                # stdout carries the MCP protocol, so report on stderr.
+                print(f"Cache warm-up failed: {result}", file=sys.stderr)
+
+    def run(self) -> Optional["asyncio.Task[None]"]:
+        """Start the MCP server from sync or async code.
+
+        Without a running event loop this blocks until the server stops. Inside
+        one it schedules the server and returns the task, so ``await
+        server.run()`` keeps working.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.arun())
+            return None
+        return asyncio.ensure_future(self.arun())
+
+    async def arun(self) -> None:
         """Start the MCP server."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.mcp.run(
-                read_stream,
-                write_stream,
-                self.mcp.create_initialization_options(),
-            )
+        # Warm-up starts before the transport so it overlaps stdio setup. Calls
+        # that arrive first share its Info client through get_info(), which
+        # builds it once off the loop; their own reads are not deduplicated.
+        warmup = asyncio.create_task(self._warm_caches())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.mcp.run(read_stream, write_stream, self._init_options)
+        finally:
+            warmup.cancel()
+            self.client_manager.close()
@@ -1,9 +1,8 @@
 """Exchange endpoint MCP tools for trade execution."""
 
 import asyncio
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
-from hyperliquid.utils.signing import OrderType
 from pydantic import ValidationError as PydanticValidationError
 
 from ..asset_router import AssetRouter
@@ -28,14 +27,17 @@ from ..validation import (
     UsdClassTransferParams,
 )
 
+if TYPE_CHECKING:
+    from hyperliquid.utils.signing import OrderType
 
-DEFAULT_MARKET_SLIPPAGE = 0.05
 
+DEFAULT_MARKET_SLIPPAGE = 0.05
 
-def _limit_order_type(tif: Literal["Alo", "Ioc", "Gtc"]) -> OrderType:
-    """Hyperliquid expects market orders as IOC limit orders."""
 
-    return {"limit": {"tif": tif}}
+# Order types are read-only to the SDK, so every order can share these.
+# Hyperliquid expects market orders as IOC limit orders.
+_GTC_ORDER_TYPE: "OrderType" = {"limit": {"tif": "Gtc"}}
+_IOC_ORDER_TYPE: "OrderType" = {"limit": {"tif": "Ioc"}}
 
 
 async def place_spot_order(
@@ -67,7 +69,7 @@ async def place_spot_order(
 
     try:
         try:
-            spot_token = asset_router.resolve_spot_symbol(user_symbol)
+            spot_token = await asset_router.resolve_spot_symbol(user_symbol)
         except AssetNotFoundError as exc:
             return format_error_response(exc)
 
@@ -106,7 +108,7 @@ async def place_spot_order(
             )
 
         try:
-            formatted_size = await decimal_manager.format_size_for_api(symbol, size)
+            formatted_size = decimal_manager.format_size(metadata, size)
         except ValueError as exc:
             if "not found" in str(exc).lower():
                 raise AssetNotFoundError(user_symbol) from exc
@@ -120,9 +122,7 @@ async def place_spot_order(
         limit_px: Optional[float] = None
         if order_type == "limit" and price is not None:
             try:
-                formatted_price = await decimal_manager.format_price_for_api(
-                    symbol, price
-                )
+                formatted_price = decimal_manager.format_price(metadata, price)
             except ValueError as exc:
                 constraint = (
                     "price must have max 5 significant figures"
@@ -140,9 +140,10 @@ async def place_spot_order(
         is_buy = side == "buy"
 
         try:
+            exchange = await client_manager.get_exchange()
             if order_type == "market":
                 result = await asyncio.to_thread(
-                    client_manager.exchange.market_open,
+                    exchange.market_open,
                     name=api_symbol,
                     is_buy=is_buy,
                     sz=float(formatted_size),
@@ -159,12 +160,12 @@ async def place_spot_order(
                         constraint="limit orders must include price",
                     )
                 result = await asyncio.to_thread(
-                    client_manager.exchange.order,
+                    exchange.order,
                     name=api_symbol,
                     is_buy=is_buy,
                     sz=float(formatted_size),
                     limit_px=limit_px,
-                    order_type=_limit_order_type("Gtc"),
+                    order_type=_GTC_ORDER_TYPE,
                     reduce_only=False,
                 )
         except Exception as exc:
@@ -241,7 +242,7 @@ async def place_perp_order(
             )
 
         try:
-            formatted_size = await decimal_manager.format_size_for_api(symbol, size)
+            formatted_size = decimal_manager.format_size(metadata, size)
         except ValueError as exc:
             raise PrecisionError(
                 message=f"Invalid size precision for {symbol}: {exc}",
@@ -253,9 +254,7 @@ async def place_perp_order(
         limit_px: Optional[float] = None
         if order_type == "limit" and price is not None:
             try:
-                formatted_price = await decimal_manager.format_price_for_api(
-                    symbol, price
-                )
+                formatted_price = decimal_manager.format_price(metadata, price)
             except ValueError as exc:
                 constraint = (
                     "price must have max 5 significant figures"
@@ -273,9 +272,10 @@ async def place_perp_order(
         is_buy = side == "buy"
 
         try:
+            exchange = await client_manager.get_exchange()
             if order_type == "market" and not reduce_only:
                 result = await asyncio.to_thread(
-                    client_manager.exchange.market_open,
+                    exchange.market_open,
                     name=symbol,
                     is_buy=is_buy,
                     sz=float(formatted_size),
@@ -285,14 +285,14 @@ async def place_perp_order(
             else:
                 if order_type == "market":
                     market_px = await asyncio.to_thread(
-                        client_manager.exchange._slippage_price,
+                        exchange._slippage_price,
                         symbol,
                         is_buy,
                         DEFAULT_MARKET_SLIPPAGE,
                         None,
                     )
                     limit_value = float(market_px)
-                    order_type_dict = _limit_order_type("Ioc")
+                    order_type_dict = _IOC_ORDER_TYPE
                 else:
                     if limit_px is None:
                         raise PrecisionError(
@@ -302,10 +302,10 @@ async def place_perp_order(
                             constraint="limit orders must include price",
                         )
                     limit_value = limit_px
-                    order_type_dict = _limit_order_type("Gtc")
+                    order_type_dict = _GTC_ORDER_TYPE
 
                 result = await asyncio.to_thread(
-                    client_manager.exchange.order,
+                    exchange.order,
                     name=symbol,
                     is_buy=is_buy,
                     sz=float(formatted_size),
@@ -361,8 +361,9 @@ async def cancel_order(
 
     try:
         try:
+            exchange = await client_manager.get_exchange()
             result = await asyncio.to_thread(
-                client_manager.exchange.cancel,
+                exchange.cancel,
                 symbol,
                 order_id,
             )
@@ -441,10 +442,11 @@ async def cancel_all_orders(
         cancelled_count = 0
         failed_cancellations: list[dict[str, Any]] = []
 
+        exchange = await client_manager.get_exchange()
         for order in orders_to_cancel:
             try:
                 result = await asyncio.to_thread(
-                    client_manager.exchange.cancel,
+                    exchange.cancel,
                     order["coin"],
                     order["oid"],
                 )
@@ -599,8 +601,9 @@ async def close_position(
         # Close position using market_close for full close, or place_perp_order for partial
         if size is None:
             try:
+                exchange = await client_manager.get_exchange()
                 result_raw = await asyncio.to_thread(
-                    client_manager.exchange.market_close,
+                    exchange.market_close,
                     symbol,
                 )
                 if result_raw.get("status") != "ok":
@@ -676,7 +679,7 @@ async def transfer_wallet_funds(
     to_perp = params.direction == "spot_to_perp"
 
     try:
-        exchange = client_manager.exchange
+        exchange = await client_manager.get_exchange()
         wallet_address = getattr(getattr(exchange, "wallet", None), "address", None)
         account_address = getattr(exchange, "account_address", None)
 
@@ -9,7 +9,7 @@ from pydantic import ValidationError as PydanticValidationError
 from ..asset_router import AssetRouter
 from ..client_manager import HyperliquidClientManager
 from ..errors import APIError, AssetNotFoundError, format_error_response
-from ..validation import MarketDataParams, WalletAddressParams
+from ..validation import MarketDataParams, PaginationParams, WalletAddressParams
 
 
 async def get_account_state(
@@ -23,7 +23,8 @@ async def get_account_state(
 
     address = params.user_address or client_manager.wallet_address
     try:
-        result = await asyncio.to_thread(client_manager.info.user_state, address)
+        info = await client_manager.get_info()
+        result = await asyncio.to_thread(info.user_state, address)
         return {"success": True, "data": result}
     except Exception as exc:
         return format_error_response(
@@ -34,19 +35,36 @@ async def get_account_state(
         )
 
 
+def _page_bounds(
+    page: PaginationParams, *lengths: int
+) -> tuple[int, int, Optional[int]]:
+    """Return the slice for ``page`` and the cursor of the following page."""
+    start = page.cursor or 0
+    longest = max(lengths, default=0)
+    end = longest if page.limit is None else min(start + page.limit, longest)
+    return start, end, end if end < longest else None
+
+
 async def get_open_orders(
     client_manager: HyperliquidClientManager,
     user_address: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
 ) -> dict[str, Any]:
     try:
         params = WalletAddressParams(user_address=user_address)
+        page = PaginationParams(limit=limit, cursor=cursor)
     except PydanticValidationError as exc:
         return format_error_response(exc)
 
     address = params.user_address or client_manager.wallet_address
     try:
-        result = await asyncio.to_thread(client_manager.info.open_orders, address)
-        return {"success": True, "data": result}
+        info = await client_manager.get_info()
+        result = await asyncio.to_thread(info.open_orders, address)
+        if page.limit is None and not page.cursor:
+            return {"success": True, "data": result}
+        start, end, next_cursor = _page_bounds(page, len(result))
+        return {"success": True, "data": result[start:end], "next_cursor": next_cursor}
     except Exception as exc:
         return format_error_response(
             APIError(
@@ -70,7 +88,8 @@ async def get_market_data(
     symbol = params.symbol
 
     try:
-        all_mids = await asyncio.to_thread(client_manager.info.all_mids)
+        info = await client_manager.get_info()
+        all_mids = await asyncio.to_thread(info.all_mids)
     except Exception as exc:
         return format_error_response(
             APIError(
@@ -83,10 +102,8 @@ async def get_market_data(
 
     if symbol in all_mids:
         try:
-            meta = await asyncio.to_thread(client_manager.info.meta)
-            meta_and_asset_ctxs = await asyncio.to_thread(
-                client_manager.info.meta_and_asset_ctxs
-            )
+            meta = await asyncio.to_thread(info.meta)
+            meta_and_asset_ctxs = await asyncio.to_thread(info.meta_and_asset_ctxs)
         except Exception as exc:
             return format_error_response(
                 APIError(
@@ -132,7 +149,7 @@ async def get_market_data(
 
     if asset_router is not None:
         try:
-            spot_info = asset_router.resolve_spot_symbol(symbol)
+            spot_info = await asset_router.resolve_spot_symbol(symbol)
             spot_lookup_symbol = spot_info.symbol
             spot_market_index = spot_info.market_index
             spot_quote_symbol = spot_info.quote_symbol
@@ -149,7 +166,7 @@ async def get_market_data(
     else:
         spot_info = None
     try:
-        spot_meta = await asyncio.to_thread(client_manager.info.spot_meta)
+        spot_meta = await asyncio.to_thread(info.spot_meta)
     except Exception:
         pass
 
@@ -191,9 +208,7 @@ async def get_market_data(
             )
 
             try:
-                spot_mids = await asyncio.to_thread(
-                    client_manager.info.spot_meta_and_asset_ctxs
-                )
+                spot_mids = await asyncio.to_thread(info.spot_meta_and_asset_ctxs)
             except Exception as exc:
                 return format_error_response(
                     APIError(
@@ -313,9 +328,17 @@ def _build_spot_context_keys(
 
 async def get_all_assets(
     client_manager: HyperliquidClientManager,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
 ) -> dict[str, Any]:
     try:
-        perp_meta = await asyncio.to_thread(client_manager.info.meta)
+        page = PaginationParams(limit=limit, cursor=cursor)
+    except PydanticValidationError as exc:
+        return format_error_response(exc)
+
+    try:
+        info = await client_manager.get_info()
+        perp_meta = await asyncio.to_thread(info.meta)
     except Exception as exc:
         return format_error_response(
             APIError(
@@ -334,7 +357,7 @@ async def get_all_assets(
     ]
 
     try:
-        spot_meta = await asyncio.to_thread(client_manager.info.spot_meta)
+        spot_meta = await asyncio.to_thread(info.spot_meta)
     except Exception as exc:
         return format_error_response(
             APIError(
@@ -354,4 +377,12 @@ async def get_all_assets(
             for token in spot_meta["tokens"]
         ]
 
-    return {"success": True, "data": {"perps": perps, "spot": spots}}
+    if page.limit is None and not page.cursor:
+        return {"success": True, "data": {"perps": perps, "spot": spots}}
+    # Both lists share one window so a cursor pages through them together.
+    start, end, next_cursor = _page_bounds(page, len(perps), len(spots))
+    return {
+        "success": True,
+        "data": {"perps": perps[start:end], "spot": spots[start:end]},
+        "next_cursor": next_cursor,
+    }
@@ -170,3 +170,8 @@ class WalletAddressParams(BaseModel):
         except ValueError as exc:
             raise ValueError("Wallet address must be hexadecimal") from exc
         return address
+
+
+class PaginationParams(BaseModel):
+    limit: Optional[int] = Field(default=None, ge=1)
+    cursor: Optional[int] = Field(default=None, ge=0)
@@ -6,9 +6,9 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from hype_mcp.asset_router import AssetRouter
+from hype_mcp.asset_router import _SHARED_METADATA, AssetRouter
 from hype_mcp.client_manager import HyperliquidClientManager
-from hype_mcp.config import HyperliquidConfig
+from hype_mcp.config import HyperliquidConfig, load_config
 from hype_mcp.decimal_manager import DecimalPrecisionManager
 
 
@@ -16,6 +16,14 @@ from hype_mcp.decimal_manager import DecimalPrecisionManager
 pytest_plugins = ("pytest_asyncio",)
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_metadata():
+    """Keep routers in one test from reusing metadata fetched by another."""
+    _SHARED_METADATA.clear()
+    yield
+    _SHARED_METADATA.clear()
+
+
 @pytest.fixture
 def test_private_key() -> str:
     """Provide a test private key for testing."""
@@ -172,6 +180,8 @@ def mock_client_manager(
     manager.base_url = "https://api.hyperliquid-testnet.xyz"
     manager.info = mock_info_client
     manager.exchange = mock_exchange_client
+    manager.get_info = AsyncMock(return_value=mock_info_client)
+    manager.get_exchange = AsyncMock(return_value=mock_exchange_client)
 
     return manager
 
@@ -201,6 +211,8 @@ async def mock_decimal_manager(mock_info_client) -> DecimalPrecisionManager:
     # Mock formatting methods
     manager.format_size_for_api = AsyncMock(return_value="0.1000")
     manager.format_price_for_api = AsyncMock(return_value="50000")
+    manager.format_size = Mock(return_value="0.1000")
+    manager.format_price = Mock(return_value="50000")
     manager.format_size_for_display = Mock(return_value=0.1)
 
     return manager
@@ -231,6 +243,7 @@ def clean_env():
     """Clean environment variables before each test."""
     # Store original environment
     original_env = os.environ.copy()
+    load_config.cache_clear()
 
     # Clear Hyperliquid-related environment variables
     for key in list(os.environ.keys()):
@@ -242,6 +255,7 @@ def clean_env():
     # Restore original environment
     os.environ.clear()
     os.environ.update(original_env)
+    load_config.cache_clear()
 
 
 # Integration test fixtures (for real API testing)
@@ -284,8 +298,7 @@ async def integration_client_manager(
 
     yield manager
 
-    # Cleanup if needed
-    # (SDK clients don't require explicit cleanup)
+    manager.close()
 
 
 @pytest.fixture
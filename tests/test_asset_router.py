@@ -1,6 +1,8 @@
 """Tests for the AssetRouter helper."""
 
+import time
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -15,7 +17,9 @@ class StubInfoClient:
         self,
         spot_tokens: list[dict[str, Any]] | None = None,
         spot_universe: list[dict[str, Any]] | None = None,
+        base_url: str | None = None,
     ):
+        self.base_url = base_url
         self._perp_meta = {
             "universe": [
                 {"name": "ETH", "szDecimals": 4, "maxLeverage": 25},
@@ -85,21 +89,34 @@ class TestAssetRouter:
     def router(self):
         return AssetRouter(StubInfoClient())
 
-    def test_resolves_u_prefix_symbol(self, router):
-        spot = router.resolve_spot_symbol("ETH")
+    async def test_resolves_u_prefix_symbol(self, router):
+        spot = await router.resolve_spot_symbol("ETH")
         assert spot.symbol == "UETH"
         assert spot.api_symbol == "@9001"
 
-    def test_resolves_full_name_alias(self, router):
-        spot = router.resolve_spot_symbol("FARTCOIN")
+    async def test_resolves_full_name_alias(self, router):
+        spot = await router.resolve_spot_symbol("FARTCOIN")
         assert spot.symbol == "UFART"
         assert spot.api_symbol == "@9002"
 
-    def test_unknown_symbol_raises(self, router):
+    async def test_unknown_symbol_raises(self, router):
         with pytest.raises(AssetNotFoundError):
-            router.resolve_spot_symbol("DOES_NOT_EXIST")
+            await router.resolve_spot_symbol("DOES_NOT_EXIST")
 
-    def test_refreshes_alias_after_ttl(self):
+    async def test_repeated_miss_does_not_refetch(self):
+        client = StubInfoClient()
+        router = AssetRouter(client)
+        with patch.object(client, "spot_meta", wraps=client.spot_meta) as spot_meta:
+            await router.ensure_ready()
+
+            for _ in range(3):
+                with pytest.raises(AssetNotFoundError):
+                    await router.resolve_spot_symbol("DOES_NOT_EXIST")
+
+        # One initial load plus a single miss-triggered refresh.
+        assert spot_meta.call_count == 2
+
+    async def test_refreshes_alias_after_ttl(self):
         initial_tokens = [
             {"name": "USDC", "szDecimals": 2, "index": 0},
             {
@@ -140,17 +157,41 @@ class TestAssetRouter:
             spot_tokens=initial_tokens, spot_universe=initial_universe
         )
         router = AssetRouter(client)
-        assert router.resolve_spot_symbol("FARTCOIN").symbol == "ULMY"
-        assert router.resolve_spot_symbol("FARTCOIN").api_symbol == "@2001"
+        await router.ensure_ready()
+        initial = await router.resolve_spot_symbol("FARTCOIN")
+        assert initial.symbol == "ULMY"
+        assert initial.api_symbol == "@2001"
 
         client.set_spot_metadata(updated_tokens, updated_universe)
-        router._last_refresh -= router.REFRESH_TTL + 1
+        router._last_refresh -= router.HARD_TTL + 1
 
-        refreshed = router.resolve_spot_symbol("FARTCOIN")
+        refreshed = await router.resolve_spot_symbol("FARTCOIN")
         assert refreshed.symbol == "UFART"
         assert refreshed.api_symbol == "@2002"
 
-    def test_refresh_on_symbol_miss(self):
+    async def test_serves_stale_alias_while_revalidating(self):
+        client = StubInfoClient()
+        router = AssetRouter(client)
+        await router.ensure_ready()
+
+        client.set_spot_metadata(
+            [
+                {"name": "USDC", "szDecimals": 2, "index": 0},
+                {"name": "UETH", "szDecimals": 4, "index": 221},
+            ],
+            [{"tokens": [221, 0], "name": "@9100", "index": 9100}],
+        )
+        router._last_refresh -= router.REFRESH_TTL + 1
+
+        stale = await router.resolve_spot_symbol("ETH")
+        assert stale.api_symbol == "@9001"
+
+        assert router._refresh_task is not None
+        await router._refresh_task
+        fresh = await router.resolve_spot_symbol("ETH")
+        assert fresh.api_symbol == "@9100"
+
+    async def test_refresh_on_symbol_miss(self):
         initial_tokens = [
             {"name": "USDC", "szDecimals": 2, "index": 0},
             {
@@ -173,6 +214,7 @@ class TestAssetRouter:
             spot_tokens=initial_tokens, spot_universe=initial_universe
         )
         router = AssetRouter(client)
+        await router.ensure_ready()
 
         client.set_spot_metadata(
             [
@@ -195,11 +237,11 @@ class TestAssetRouter:
             ],
         )
 
-        refreshed = router.resolve_spot_symbol("FARTCOIN")
+        refreshed = await router.resolve_spot_symbol("FARTCOIN")
         assert refreshed.symbol == "UFART"
         assert refreshed.api_symbol == "@3002"
 
-    def test_prefers_usdc_pair_when_available(self):
+    async def test_prefers_usdc_pair_when_available(self):
         tokens = [
             {"name": "USDC", "szDecimals": 2, "index": 0},
             {"name": "UETH", "szDecimals": 4, "index": 10},
@@ -212,11 +254,11 @@ class TestAssetRouter:
         client = StubInfoClient(spot_tokens=tokens, spot_universe=universe)
         router = AssetRouter(client)
 
-        spot = router.resolve_spot_symbol("HYPE")
+        spot = await router.resolve_spot_symbol("HYPE")
         assert spot.market_index == 4002
         assert spot.quote_token_index == 0
 
-    def test_falls_back_to_major_quote_when_usdc_missing(self):
+    async def test_falls_back_to_major_quote_when_usdc_missing(self):
         tokens = [
             {"name": "USDC", "szDecimals": 2, "index": 0},
             {"name": "UBTC", "szDecimals": 4, "index": 11},
@@ -230,12 +272,63 @@ class TestAssetRouter:
         client = StubInfoClient(spot_tokens=tokens, spot_universe=universe)
         router = AssetRouter(client)
 
-        spot = router.resolve_spot_symbol("HYPE")
+        spot = await router.resolve_spot_symbol("HYPE")
         # UETH (index 10) should be preferred over UBTC when USDC pair missing
         assert spot.market_index == 5001
         assert spot.quote_token_index == 10
 
-    def test_canonical_symbol_overrides_alias_collisions(self):
+    async def test_construction_defers_metadata_fetch(self):
+        client = StubInfoClient()
+        with patch.object(client, "meta", wraps=client.meta) as meta:
+            router = AssetRouter(client)
+            meta.assert_not_called()
+
+            await router.ensure_ready()
+            await router.ensure_ready()
+        meta.assert_called_once()
+
+    async def test_unchanged_metadata_skips_rebuild(self):
+        router = AssetRouter(StubInfoClient())
+        await router.ensure_ready()
+        alias_map = router._spot_alias_map
+        router._last_refresh -= router.HARD_TTL + 1
+
+        router.refresh()
+
+        assert router._spot_alias_map is alias_map
+        assert time.time() - router._last_refresh < router.REFRESH_TTL
+
+    async def test_resolution_cache_cleared_on_rebuild(self):
+        client = StubInfoClient()
+        router = AssetRouter(client)
+        first = await router.resolve_spot_symbol("eth")
+        assert router._resolve_cache["eth"] is first
+
+        client.set_spot_metadata(
+            [
+                {"name": "USDC", "szDecimals": 2, "index": 0},
+                {"name": "UETH", "szDecimals": 4, "index": 221},
+            ],
+            [{"tokens": [221, 0], "name": "@9100", "index": 9100}],
+        )
+        router.refresh()
+
+        assert not router._resolve_cache
+        assert (await router.resolve_spot_symbol("eth")).api_symbol == "@9100"
+
+    async def test_routers_share_metadata_per_base_url(self):
+        first_client = StubInfoClient(base_url="https://shared.test")
+        second_client = StubInfoClient(base_url="https://shared.test")
+
+        await AssetRouter(first_client).ensure_ready()
+        router = AssetRouter(second_client)
+        with patch.object(second_client, "meta", wraps=second_client.meta) as meta:
+            await router.ensure_ready()
+
+        meta.assert_not_called()
+        assert (await router.resolve_spot_symbol("ETH")).api_symbol == "@9001"
+
+    async def test_canonical_symbol_overrides_alias_collisions(self):
         tokens = [
             {"name": "USDC", "szDecimals": 2, "index": 0},
             {
@@ -264,6 +357,6 @@ class TestAssetRouter:
         client = StubInfoClient(spot_tokens=tokens, spot_universe=universe)
         router = AssetRouter(client)
 
-        spot = router.resolve_spot_symbol("HYPE")
+        spot = await router.resolve_spot_symbol("HYPE")
         assert spot.symbol == "HYPE"
         assert spot.market_index == 6001
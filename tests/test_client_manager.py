@@ -0,0 +1,249 @@
+"""Tests for the Hyperliquid client manager."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hype_mcp.client_manager import HyperliquidClientManager, _Info
+
+BASE_URL = "https://api.hyperliquid-testnet.xyz"
+EMPTY_META = b'{"tokens": [], "universe": []}'
+
+
+def _response(content: bytes = EMPTY_META, status_code: int = 200) -> Mock:
+    return Mock(status_code=status_code, content=content, text=content.decode())
+
+
+@pytest.fixture
+def shared_session():
+    """A stand-in for the pooled session that answers every POST."""
+    session = Mock()
+    session.post.return_value = _response()
+    return session
+
+
+@pytest.fixture
+def manager(test_wallet_address, test_private_key):
+    """Create a client manager without touching the network."""
+    return HyperliquidClientManager(
+        testnet=True,
+        wallet_address=test_wallet_address,
+        private_key=test_private_key,
+    )
+
+
+class TestSharedSession:
+    """Tests for the pooled session shared by the SDK clients."""
+
+    def test_info_constructor_fetches_use_shared_session(self, shared_session):
+        """Test that Info's constructor requests go through the shared session."""
+        info = _Info(base_url=BASE_URL, skip_ws=True, session=shared_session)
+
+        posted = [
+            call.kwargs["json"]["type"] for call in shared_session.post.mock_calls
+        ]
+        assert posted == ["spotMeta", "meta"]
+        assert info.session is shared_session
+
+    def test_exchange_sessions_replaced_and_closed(self, manager):
+        """Test that the Exchange's own sessions are closed and replaced."""
+        exchange = Mock()
+        own_session, own_info_session = exchange.session, exchange.info.session
+        with patch("hyperliquid.exchange.Exchange", return_value=exchange):
+            assert manager.exchange is exchange
+
+        own_session.close.assert_called_once()
+        own_info_session.close.assert_called_once()
+        assert exchange.session is manager._session
+        assert exchange.info.session is manager._session
+
+    def test_close_stops_websocket_and_session(self, manager):
+        """Test that close() stops the websocket and releases the pool."""
+        manager._session = Mock()
+        manager._info_client = Mock()
+
+        manager.close()
+
+        manager._info_client.disconnect_websocket.assert_called_once()
+        manager._session.close.assert_called_once()
+
+    def test_close_without_info_client(self, manager):
+        """Test that close() works before the Info client was built."""
+        manager._session = Mock()
+
+        manager.close()
+
+        manager._session.close.assert_called_once()
+
+
+class TestRequestCoalescing:
+    """Tests for sharing overlapping identical Info requests."""
+
+    @pytest.fixture
+    def info(self, shared_session):
+        """An Info client whose constructor fetches are already done."""
+        return _Info(base_url=BASE_URL, skip_ws=True, session=shared_session)
+
+    def _post_concurrently(self, info, payloads):
+        started = threading.Barrier(len(payloads))
+
+        def post(payload):
+            started.wait()
+            return info.post("/info", payload)
+
+        with ThreadPoolExecutor(len(payloads)) as pool:
+            futures = [pool.submit(post, payload) for payload in payloads]
+        return futures
+
+    def test_identical_posts_share_one_request(self, info):
+        """Test that overlapping identical posts make one HTTP call."""
+        calls = []
+
+        def slow_request(url_path, payload):
+            calls.append(payload)
+            time.sleep(0.05)
+            return {"BTC": "1"}
+
+        with patch.object(info, "_request", side_effect=slow_request):
+            futures = self._post_concurrently(info, [{"type": "allMids"}] * 4)
+
+        results = [future.result() for future in futures]
+        assert calls == [{"type": "allMids"}]
+        assert all(result is results[0] for result in results)
+        assert info._inflight == {}
+
+    def test_different_payloads_are_not_shared(self, info):
+        """Test that posts with different payloads each make a request."""
+        with patch.object(info, "_request", return_value={}) as request:
+            self._post_concurrently(info, [{"type": "meta"}, {"type": "allMids"}])
+
+        assert request.call_count == 2
+
+    def test_error_reaches_every_waiter(self, info):
+        """Test that a failed request raises in all callers and is not kept."""
+
+        def failing_request(url_path, payload):
+            time.sleep(0.05)
+            raise ConnectionError("down")
+
+        with patch.object(info, "_request", side_effect=failing_request) as request:
+            futures = self._post_concurrently(info, [{"type": "meta"}] * 3)
+
+        for future in futures:
+            with pytest.raises(ConnectionError, match="down"):
+                future.result()
+        assert request.call_count == 1
+        assert info._inflight == {}
+
+
+class TestLazyClients:
+    """Tests for building the SDK clients on first use."""
+
+    async def test_concurrent_first_calls_build_one_info(self, manager):
+        """Test that overlapping first get_info() calls share one client."""
+        built = []
+        loop_thread = threading.get_ident()
+
+        def slow_info(**kwargs):
+            assert threading.get_ident() != loop_thread
+            time.sleep(0.05)
+            built.append(Mock())
+            return built[-1]
+
+        with patch("hype_mcp.client_manager._Info", side_effect=slow_info):
+            clients = await asyncio.gather(*(manager.get_info() for _ in range(8)))
+
+        assert len(built) == 1
+        assert all(client is built[0] for client in clients)
+        assert manager.info is built[0]
+
+    async def test_concurrent_first_calls_build_one_exchange(self, manager):
+        """Test that overlapping first get_exchange() calls share one client."""
+        built = []
+
+        def slow_exchange():
+            time.sleep(0.05)
+            built.append(Mock())
+            return built[-1]
+
+        with patch.object(manager, "_build_exchange", side_effect=slow_exchange):
+            clients = await asyncio.gather(*(manager.get_exchange() for _ in range(8)))
+
+        assert len(built) == 1
+        assert all(client is built[0] for client in clients)
+
+    def test_failed_info_construction_stops_websocket(self, shared_session):
+        """Test that a failed metadata fetch does not leave the websocket running."""
+        shared_session.post.return_value = _response(b"{}", status_code=500)
+        ws_manager = Mock()
+
+        with (
+            patch("hyperliquid.info.WebsocketManager", return_value=ws_manager),
+            pytest.raises(Exception),
+        ):
+            _Info(base_url=BASE_URL, skip_ws=False, session=shared_session)
+
+        ws_manager.start.assert_called_once()
+        ws_manager.stop.assert_called_once()
+
+
+def test_server_import_defers_signing_dependencies():
+    """Test that eth_account is only imported once an order is signed."""
+    code = (
+        "import sys, hype_mcp.server; "
+        "print('eth_account' in sys.modules, 'hyperliquid.exchange' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+class TestValidateConnection:
+    """Tests for the startup connectivity check."""
+
+    async def test_returns_true_when_mids_load(self, manager):
+        """Test that a non-empty allMids response validates the connection."""
+        manager._info_client = Mock()
+        manager._info_client.all_mids.return_value = {"BTC": "1"}
+
+        assert await manager.validate_connection() is True
+
+    async def test_times_out(self, manager):
+        """Test that a hung API is reported as a connection error."""
+        manager._info_client = Mock()
+        manager._info_client.all_mids.side_effect = lambda: time.sleep(0.2)
+
+        with (
+            patch("hype_mcp.client_manager.VALIDATE_TIMEOUT", 0.01),
+            pytest.raises(ConnectionError, match="Timed out after 0.01s"),
+        ):
+            await manager.validate_connection()
+
+    async def test_timeout_covers_building_info(self, manager):
+        """Test that a slow first Info construction is also bounded."""
+
+        def slow_info(**kwargs):
+            time.sleep(0.2)
+            return Mock()
+
+        with (
+            patch("hype_mcp.client_manager._Info", side_effect=slow_info),
+            patch("hype_mcp.client_manager.VALIDATE_TIMEOUT", 0.01),
+            pytest.raises(ConnectionError, match="Timed out"),
+        ):
+            await manager.validate_connection()
+
+    async def test_api_error_is_wrapped(self, manager):
+        """Test that request failures surface as connection errors."""
+        manager._info_client = Mock()
+        manager._info_client.all_mids.side_effect = OSError("refused")
+
+        with pytest.raises(ConnectionError, match="Failed to connect.*refused"):
+            await manager.validate_connection()
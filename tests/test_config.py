@@ -44,6 +44,8 @@ class TestHyperliquidConfig:
 
             assert config.wallet_address == expected_address
             assert config.private_key == private_key
+            assert config.local_account is not None
+            assert config.local_account.address == expected_address
 
     def test_from_env_missing_private_key(self):
         """Test that missing private key raises ValueError."""
@@ -51,6 +53,20 @@ class TestHyperliquidConfig:
             with pytest.raises(ValueError, match="HYPERLIQUID_PRIVATE_KEY.*required"):
                 HyperliquidConfig.from_env()
 
+    def test_from_env_with_explicit_mapping(self):
+        """Test loading configuration from a mapping instead of os.environ."""
+        env = {
+            "HYPERLIQUID_PRIVATE_KEY": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "HYPERLIQUID_WALLET_ADDRESS": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1",
+            "HYPERLIQUID_TESTNET": "false",
+        }
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = HyperliquidConfig.from_env(env)
+
+        assert config.wallet_address == env["HYPERLIQUID_WALLET_ADDRESS"]
+        assert config.testnet is False
+
     def test_from_env_testnet_flag_variations(self):
         """Test various testnet flag values."""
         private_key = (
@@ -89,6 +105,23 @@ class TestHyperliquidConfig:
             config = HyperliquidConfig.from_env()
             assert config.testnet is True
 
+    def test_from_env_max_concurrency(self):
+        """Test that max concurrency is read from the environment."""
+        private_key = (
+            "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+        )
+        env = {
+            "HYPERLIQUID_PRIVATE_KEY": private_key,
+            "HYPERLIQUID_WALLET_ADDRESS": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1",
+        }
+
+        assert HyperliquidConfig.from_env(env).max_concurrency == 8
+        env["HYPERLIQUID_MAX_CONCURRENCY"] = "3"
+        assert HyperliquidConfig.from_env(env).max_concurrency == 3
+        env["HYPERLIQUID_MAX_CONCURRENCY"] = "many"
+        with pytest.raises(ValueError, match="HYPERLIQUID_MAX_CONCURRENCY"):
+            HyperliquidConfig.from_env(env)
+
     def test_normalize_private_key_with_prefix(self):
         """Test normalizing private key that already has 0x prefix."""
         key = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
@@ -188,6 +221,16 @@ class TestHyperliquidConfig:
         with pytest.raises(ValueError, match="Invalid wallet address format"):
             config.validate()
 
+    def test_validate_max_concurrency(self):
+        """Test validation fails when max concurrency is below one."""
+        config = HyperliquidConfig(
+            private_key="0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1",
+            max_concurrency=0,
+        )
+        with pytest.raises(ValueError, match="Max concurrency must be at least 1"):
+            config.validate()
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -206,6 +249,16 @@ class TestLoadConfig:
             assert config.wallet_address == env_vars["HYPERLIQUID_WALLET_ADDRESS"]
             assert config.testnet is True
 
+    def test_load_config_is_cached(self):
+        """Test that repeated calls reuse the parsed configuration."""
+        env_vars = {
+            "HYPERLIQUID_PRIVATE_KEY": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "HYPERLIQUID_WALLET_ADDRESS": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert load_config() is load_config()
+
     def test_load_config_missing_private_key(self):
         """Test that load_config raises ValueError when private key is missing."""
         with patch.dict(os.environ, {}, clear=True):
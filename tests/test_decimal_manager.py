@@ -1,9 +1,11 @@
 """Tests for decimal precision manager."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock
 
-from hype_mcp.decimal_manager import DecimalPrecisionManager
+from hype_mcp.decimal_manager import DecimalPrecisionManager, _MetaIndex
 
 
 class TestDecimalPrecisionManager:
@@ -19,6 +21,7 @@ class TestDecimalPrecisionManager:
                     {"name": "BTC", "szDecimals": 4, "maxLeverage": 50},
                     {"name": "ETH", "szDecimals": 3, "maxLeverage": 50},
                     {"name": "SOL", "szDecimals": 2, "maxLeverage": 20},
+                    {"name": "MICRO", "szDecimals": 6, "maxLeverage": 3},
                 ],
             }
         )
@@ -74,6 +77,41 @@ class TestDecimalPrecisionManager:
         assert mock_info_client.meta.call_count == 1  # Still 1, not 2
         assert mock_info_client.spot_meta.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_get_asset_metadata_shares_meta_across_symbols(
+        self, manager, mock_info_client
+    ):
+        """Test that different symbols reuse a single metadata fetch."""
+        await asyncio.gather(
+            manager.get_asset_metadata("BTC"),
+            manager.get_asset_metadata("ETH"),
+            manager.get_asset_metadata("PURR"),
+        )
+        assert mock_info_client.meta.call_count == 1
+        assert mock_info_client.spot_meta.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_asset_metadata_refetches_after_expiry(
+        self, manager, mock_info_client
+    ):
+        """Test that an expired snapshot triggers a fresh metadata fetch."""
+        await manager.get_asset_metadata("BTC")
+        manager._cache_expiry = 0.0
+
+        await manager.get_asset_metadata("BTC")
+        assert mock_info_client.meta.call_count == 2
+        assert mock_info_client.spot_meta.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_all_populates_every_symbol(self, manager, mock_info_client):
+        """Test that warm_all caches every listed asset from one fetch."""
+        await manager.warm_all()
+
+        for symbol in ("BTC", "ETH", "SOL", "MICRO", "PURR", "HYPE"):
+            assert manager._peek_metadata(symbol) is not None
+        assert mock_info_client.meta.call_count == 1
+        assert mock_info_client.spot_meta.call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_asset_metadata_not_found(self, manager):
         """Test that unknown asset raises ValueError."""
@@ -136,6 +174,39 @@ class TestDecimalPrecisionManager:
         result = await manager.format_size_for_api("BTC", 100)
         assert result == "100"
 
+    @pytest.mark.asyncio
+    async def test_format_size_for_api_keeps_decimal_digits(self, manager):
+        """Test that truncation follows the printed digits, not binary error."""
+        # SOL has szDecimals=2; 0.29 is stored as 0.28999...
+        assert await manager.format_size_for_api("SOL", 0.29) == "0.29"
+        assert await manager.format_size_for_api("MICRO", 0.0) == "0"
+
+    @pytest.mark.asyncio
+    async def test_format_size_for_api_memoized(self, manager):
+        """Test that repeated sizes reuse the formatted output."""
+        first = await manager.format_size_for_api("BTC", 0.12345)
+        manager._format_size = Mock(side_effect=AssertionError("not cached"))
+
+        assert await manager.format_size_for_api("BTC", 0.12345) == first
+
+    @pytest.mark.asyncio
+    async def test_format_cache_cleared_on_refetch(self, manager):
+        """Test that formatted outputs are dropped with the metadata snapshot."""
+        await manager.format_price_for_api("BTC", 1234.5)
+        assert manager._price_cache
+
+        manager._cache_expiry = 0.0
+        await manager.get_asset_metadata("BTC")
+        assert not manager._price_cache
+
+    @pytest.mark.asyncio
+    async def test_format_with_held_metadata(self, manager):
+        """Test formatting with metadata the caller already fetched."""
+        metadata = await manager.get_asset_metadata("BTC")
+
+        assert manager.format_size(metadata, 0.12345) == "0.1234"
+        assert manager.format_price(metadata, 1234.5) == "1234.5"
+
     @pytest.mark.asyncio
     async def test_format_price_for_api_basic(self, manager):
         """Test basic price formatting."""
@@ -185,6 +256,13 @@ class TestDecimalPrecisionManager:
         result = await manager.format_price_for_api("BTC", 123.45)
         assert result == "123.45"
 
+    @pytest.mark.asyncio
+    async def test_format_price_for_api_zero_price_decimals(self, manager):
+        """Test that whole-number truncation keeps trailing integer zeros."""
+        # MICRO perp: max_decimals=6, sz_decimals=6, max_price_decimals=0
+        result = await manager.format_price_for_api("MICRO", 120.5)
+        assert result == "120"
+
     @pytest.mark.asyncio
     async def test_format_price_for_api_edge_cases(self, manager):
         """Test edge cases for price formatting."""
@@ -196,35 +274,21 @@ class TestDecimalPrecisionManager:
         result = await manager.format_price_for_api("PURR", 0.0000001)
         assert result == "0"
 
-    @pytest.mark.asyncio
-    async def test_detect_asset_type_perp(self, manager, mock_info_client):
-        """Test detecting perpetual asset type."""
-        perp_meta = mock_info_client.meta()
-        spot_meta = mock_info_client.spot_meta()
-        asset_type = manager._detect_asset_type("BTC", perp_meta, spot_meta)
-        assert asset_type == "perp"
-
-    @pytest.mark.asyncio
-    async def test_detect_asset_type_spot(self, manager, mock_info_client):
-        """Test detecting spot asset type."""
-        perp_meta = mock_info_client.meta()
-        spot_meta = mock_info_client.spot_meta()
-        asset_type = manager._detect_asset_type("PURR", perp_meta, spot_meta)
-        assert asset_type == "spot"
+    def test_extract_metadata_perp(self, manager, mock_info_client):
+        """Test extracting perpetual asset metadata."""
+        index = _MetaIndex.build(mock_info_client.meta(), mock_info_client.spot_meta())
+        metadata = manager._extract_metadata("BTC", index)
 
-    @pytest.mark.asyncio
-    async def test_detect_asset_type_not_found(self, manager, mock_info_client):
-        """Test that unknown asset raises ValueError."""
-        perp_meta = mock_info_client.meta()
-        spot_meta = mock_info_client.spot_meta()
-        with pytest.raises(ValueError, match="Asset 'INVALID' not found"):
-            manager._detect_asset_type("INVALID", perp_meta, spot_meta)
+        assert metadata.symbol == "BTC"
+        assert metadata.asset_type == "perp"
+        assert metadata.sz_decimals == 4
+        assert metadata.max_decimals == 6
+        assert metadata.max_leverage == 50
 
-    @pytest.mark.asyncio
-    async def test_extract_spot_metadata(self, manager, mock_info_client):
+    def test_extract_metadata_spot(self, manager, mock_info_client):
         """Test extracting spot asset metadata."""
-        spot_meta = mock_info_client.spot_meta()
-        metadata = manager._extract_spot_metadata("PURR", spot_meta)
+        index = _MetaIndex.build(mock_info_client.meta(), mock_info_client.spot_meta())
+        metadata = manager._extract_metadata("PURR", index)
 
         assert metadata.symbol == "PURR"
         assert metadata.asset_type == "spot"
@@ -232,14 +296,16 @@ class TestDecimalPrecisionManager:
         assert metadata.max_decimals == 8
         assert metadata.max_leverage is None
 
-    @pytest.mark.asyncio
-    async def test_extract_perp_metadata(self, manager, mock_info_client):
-        """Test extracting perpetual asset metadata."""
-        meta_response = mock_info_client.meta()
-        metadata = manager._extract_perp_metadata("BTC", meta_response)
+    def test_extract_metadata_prefers_spot_on_name_collision(self, manager):
+        """Test that a name listed as both spot and perp resolves to spot."""
+        index = _MetaIndex.build(
+            {"universe": [{"name": "HYPE", "szDecimals": 2, "maxLeverage": 5}]},
+            {"tokens": [{"name": "HYPE", "szDecimals": 1, "index": 1}]},
+        )
+        assert manager._extract_metadata("HYPE", index).asset_type == "spot"
 
-        assert metadata.symbol == "BTC"
-        assert metadata.asset_type == "perp"
-        assert metadata.sz_decimals == 4
-        assert metadata.max_decimals == 6
-        assert metadata.max_leverage == 50
+    def test_extract_metadata_not_found(self, manager, mock_info_client):
+        """Test that unknown asset raises ValueError."""
+        index = _MetaIndex.build(mock_info_client.meta(), mock_info_client.spot_meta())
+        with pytest.raises(ValueError, match="Asset 'INVALID' not found"):
+            manager._extract_metadata("INVALID", index)
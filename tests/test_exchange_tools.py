@@ -1,7 +1,7 @@
 """Tests for exchange endpoint helpers."""
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 from hype_mcp.models import AssetMetadata
 from hype_mcp.tools.exchange_tools import place_spot_order, transfer_wallet_funds
@@ -24,7 +24,7 @@ class TestPlaceSpotOrder:
             spot_index=12,
         )
         mock_decimal_manager.get_asset_metadata = AsyncMock(return_value=metadata)
-        mock_decimal_manager.format_size_for_api = AsyncMock(return_value="1")
+        mock_decimal_manager.format_size = Mock(return_value="1")
         mock_client_manager.exchange.market_open.reset_mock()
 
         result = await place_spot_order(
@@ -39,7 +39,9 @@ class TestPlaceSpotOrder:
 
         assert result["success"] is True
         mock_client_manager.exchange.market_open.assert_called_once()
-        expected_symbol = mock_asset_router.resolve_spot_symbol("PURR").api_symbol
+        expected_symbol = (
+            await mock_asset_router.resolve_spot_symbol("PURR")
+        ).api_symbol
         assert (
             mock_client_manager.exchange.market_open.call_args.kwargs["name"]
             == expected_symbol
@@ -59,8 +61,8 @@ class TestPlaceSpotOrder:
             spot_index=34,
         )
         mock_decimal_manager.get_asset_metadata = AsyncMock(return_value=metadata)
-        mock_decimal_manager.format_size_for_api = AsyncMock(return_value="1")
-        mock_decimal_manager.format_price_for_api = AsyncMock(return_value="0.1")
+        mock_decimal_manager.format_size = Mock(return_value="1")
+        mock_decimal_manager.format_price = Mock(return_value="0.1")
         mock_client_manager.exchange.order.reset_mock()
 
         result = await place_spot_order(
@@ -76,7 +78,9 @@ class TestPlaceSpotOrder:
 
         assert result["success"] is True
         mock_client_manager.exchange.order.assert_called_once()
-        expected_symbol = mock_asset_router.resolve_spot_symbol("PURR").api_symbol
+        expected_symbol = (
+            await mock_asset_router.resolve_spot_symbol("PURR")
+        ).api_symbol
         assert (
             mock_client_manager.exchange.order.call_args.kwargs["name"]
             == expected_symbol
@@ -96,7 +100,7 @@ class TestPlaceSpotOrder:
             spot_index=None,
         )
         mock_decimal_manager.get_asset_metadata = AsyncMock(return_value=metadata)
-        mock_decimal_manager.format_size_for_api = AsyncMock(return_value="1")
+        mock_decimal_manager.format_size = Mock(return_value="1")
 
         result = await place_spot_order(
             mock_client_manager,
@@ -124,7 +128,7 @@ class TestPlaceSpotOrder:
             max_leverage=50,
         )
         mock_decimal_manager.get_asset_metadata = AsyncMock(return_value=metadata)
-        mock_decimal_manager.format_size_for_api = AsyncMock(return_value="0.1")
+        mock_decimal_manager.format_size = Mock(return_value="0.1")
 
         result = await place_spot_order(
             mock_client_manager,
@@ -0,0 +1,472 @@
+"""Tests for the MCP server's tool dispatch."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from hype_mcp.server import HyperliquidMCPServer
+
+
+def _stub(server, name, *results, delay=0.0):
+    """Replace a tool handler with one that returns (or raises) canned results."""
+
+    async def handler(**kwargs):
+        await asyncio.sleep(delay)
+        return {"success": True, "data": kwargs}
+
+    mock = AsyncMock(side_effect=list(results) or handler)
+    server._tool_handlers[name] = mock
+    return mock
+
+
+async def _call(server, name, arguments):
+    """Call a tool through the MCP entry point and decode its JSON text."""
+    (content,) = await server._handle_call_tool(name, arguments)
+    return json.loads(content.text)
+
+
+@pytest.fixture
+def make_server(test_config):
+    """Build servers around the real client manager without an MCP transport."""
+
+    def factory(config=test_config):
+        with patch("hype_mcp.server.Server"):
+            return HyperliquidMCPServer(config)
+
+    return factory
+
+
+class TestLazyHelpers:
+    """Tests for the lazily created SDK client and helpers."""
+
+    async def test_warm_up_and_early_call_share_one_info(
+        self, make_server, mock_info_client
+    ):
+        """Test that warm-up racing an early read builds a single Info client."""
+        server = make_server()
+        built = []
+
+        def slow_info(**kwargs):
+            time.sleep(0.05)
+            built.append(kwargs)
+            return mock_info_client
+
+        with patch("hype_mcp.client_manager._Info", side_effect=slow_info):
+            _, text = await asyncio.gather(
+                server._warm_caches(),
+                server._dispatch_one("get_open_orders", {}),
+            )
+
+        assert len(built) == 1
+        assert text == '{"success":true,"data":[]}'
+
+
+class TestBatchCall:
+    """Tests for the batch_call tool."""
+
+    async def test_results_keep_request_order(self, make_server):
+        """Test that results follow the order of the calls, not completion."""
+        server = make_server()
+        _stub(server, "get_open_orders", delay=0.05)
+        _stub(server, "get_account_state")
+
+        result = await _call(
+            server,
+            "batch_call",
+            {
+                "calls": [
+                    {"name": "get_open_orders", "arguments": {"limit": 1}},
+                    {"name": "get_account_state", "arguments": {}},
+                ]
+            },
+        )
+
+        assert result == {
+            "success": True,
+            "data": [
+                {"success": True, "data": {"limit": 1}},
+                {"success": True, "data": {}},
+            ],
+        }
+
+    async def test_failing_item_does_not_affect_others(self, make_server):
+        """Test that one item's error is reported in its own slot."""
+        server = make_server()
+        _stub(server, "get_open_orders", RuntimeError("boom"))
+        _stub(server, "get_account_state")
+
+        result = await _call(
+            server,
+            "batch_call",
+            {
+                "calls": [
+                    {"name": "get_open_orders"},
+                    {"name": "get_account_state"},
+                    {"name": "no_such_tool"},
+                    {"name": "get_market_data", "arguments": {}},
+                ]
+            },
+        )
+
+        failed, ok, unknown, missing = result["data"]
+        assert result["success"] is True
+        assert failed == {
+            "success": False,
+            "error": "boom",
+            "error_type": "RuntimeError",
+        }
+        assert ok == {"success": True, "data": {}}
+        assert unknown == {"success": False, "error": "Unknown tool: no_such_tool"}
+        assert missing["error_type"] == "ValidationError"
+        assert missing["details"]["field"] == "symbol"
+
+    async def test_invalid_and_nested_items(self, make_server):
+        """Test that malformed items and nested batches are rejected per item."""
+        server = make_server()
+        _stub(server, "get_account_state")
+
+        result = await _call(
+            server,
+            "batch_call",
+            {
+                "calls": [
+                    "get_account_state",
+                    {"name": 5},
+                    {"arguments": {}},
+                    {"name": "batch_call", "arguments": {"calls": []}},
+                    {"name": "get_account_state"},
+                ]
+            },
+        )
+
+        *invalid, nested, ok = result["data"]
+        for item in invalid:
+            assert item["success"] is False
+            assert item["details"]["field"] == "calls"
+        assert nested == {"success": False, "error": "Unknown tool: batch_call"}
+        assert ok == {"success": True, "data": {}}
+
+    async def test_missing_calls(self, make_server):
+        """Test that a batch without calls reports the missing parameter."""
+        server = make_server()
+
+        for arguments in (None, {}):
+            result = await _call(server, "batch_call", arguments)
+            assert result["success"] is False
+            assert result["error"] == "calls parameter is required"
+
+    async def test_non_list_calls(self, make_server):
+        """Test that calls must be a list."""
+        server = make_server()
+
+        result = await _call(server, "batch_call", {"calls": {"name": "x"}})
+
+        assert result["success"] is False
+        assert result["details"]["field"] == "calls"
+
+    async def test_empty_calls(self, make_server):
+        """Test that an empty batch returns an empty result list."""
+        server = make_server()
+
+        result = await _call(server, "batch_call", {"calls": []})
+
+        assert result == {"success": True, "data": []}
+
+
+class TestSingleFlight:
+    """Tests for sharing identical concurrent reads."""
+
+    async def test_identical_reads_share_one_call(self, make_server):
+        """Test that overlapping identical reads reach the handler once."""
+        server = make_server()
+        handler = _stub(server, "get_open_orders", delay=0.05)
+
+        texts = await asyncio.gather(
+            *(server._dispatch_one("get_open_orders", {"limit": 5}) for _ in range(5))
+        )
+
+        handler.assert_awaited_once_with(limit=5)
+        assert len(set(texts)) == 1
+        assert server._inflight == {}
+
+    async def test_different_arguments_are_not_shared(self, make_server):
+        """Test that reads with different arguments each reach the handler."""
+        server = make_server()
+        handler = _stub(server, "get_open_orders", delay=0.05)
+
+        await asyncio.gather(
+            server._dispatch_one("get_open_orders", {"limit": 5}),
+            server._dispatch_one("get_open_orders", {"limit": 6}),
+        )
+
+        assert handler.await_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self, make_server):
+        """Test that one waiter going away leaves the shared call running."""
+        server = make_server()
+        handler = _stub(server, "get_open_orders", delay=0.05)
+
+        first = asyncio.ensure_future(server._dispatch_one("get_open_orders", {}))
+        second = asyncio.ensure_future(server._dispatch_one("get_open_orders", {}))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == '{"success":true,"data":{}}'
+        handler.assert_awaited_once()
+
+    async def test_writes_are_not_shared(self, make_server):
+        """Test that identical writes each reach the handler."""
+        server = make_server()
+        handler = _stub(server, "cancel_all_orders", delay=0.05)
+
+        await asyncio.gather(
+            server._dispatch_one("cancel_all_orders", {}),
+            server._dispatch_one("cancel_all_orders", {}),
+        )
+
+        assert handler.await_count == 2
+
+
+class TestResultCache:
+    """Tests for reusing recent read results."""
+
+    @pytest.fixture
+    def clock(self):
+        """Control the monotonic clock the server reads cache expiry from."""
+        with patch("hype_mcp.server.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            yield mock_time
+
+    async def test_result_reused_until_ttl_expires(self, make_server, clock):
+        """Test that a cached read is served until its TTL passes."""
+        server = make_server()
+        server.asset_router = Mock()
+        handler = _stub(
+            server,
+            "get_market_data",
+            {"success": True, "data": 1},
+            {"success": True, "data": 2},
+        )
+
+        first = await server._dispatch_one("get_market_data", {"symbol": "BTC"})
+        clock.monotonic.return_value = 100.2
+        cached = await server._dispatch_one("get_market_data", {"symbol": "BTC"})
+        clock.monotonic.return_value = 100.3
+        refreshed = await server._dispatch_one("get_market_data", {"symbol": "BTC"})
+
+        assert first == cached == '{"success":true,"data":1}'
+        assert refreshed == '{"success":true,"data":2}'
+        assert handler.await_count == 2
+
+    async def test_ttl_is_per_tool(self, make_server, clock):
+        """Test that asset listings outlive the short market-data TTL."""
+        server = make_server()
+        handler = _stub(
+            server,
+            "get_all_assets",
+            {"success": True, "data": 1},
+            {"success": True, "data": 2},
+        )
+
+        await server._dispatch_one("get_all_assets", {})
+        clock.monotonic.return_value = 129.0
+        await server._dispatch_one("get_all_assets", {})
+        clock.monotonic.return_value = 130.0
+        await server._dispatch_one("get_all_assets", {})
+
+        assert handler.await_count == 2
+
+    async def test_cache_key_includes_arguments(self, make_server, clock):
+        """Test that different arguments are cached separately."""
+        server = make_server()
+        handler = _stub(server, "get_all_assets")
+
+        await server._dispatch_one("get_all_assets", {"limit": 1})
+        await server._dispatch_one("get_all_assets", {"limit": 2})
+        await server._dispatch_one("get_all_assets", {"limit": 1})
+
+        assert handler.await_count == 2
+
+    async def test_failures_are_not_cached(self, make_server, clock):
+        """Test that an error result is retried on the next call."""
+        server = make_server()
+        handler = _stub(
+            server,
+            "get_all_assets",
+            {"success": False, "error": "down"},
+            {"success": True, "data": []},
+        )
+
+        await server._dispatch_one("get_all_assets", {})
+        text = await server._dispatch_one("get_all_assets", {})
+
+        assert text == '{"success":true,"data":[]}'
+        assert handler.await_count == 2
+
+    async def test_write_invalidates_account_state(self, make_server, clock):
+        """Test that a write drops cached account state but keeps other reads."""
+        server = make_server()
+        account = _stub(
+            server,
+            "get_account_state",
+            {"success": True, "data": "before"},
+            {"success": True, "data": "after"},
+        )
+        assets = _stub(server, "get_all_assets")
+        _stub(server, "cancel_all_orders")
+
+        await server._dispatch_one("get_account_state", {})
+        await server._dispatch_one("get_all_assets", {})
+        await server._dispatch_one("cancel_all_orders", {})
+        text = await server._dispatch_one("get_account_state", {})
+        await server._dispatch_one("get_all_assets", {})
+
+        assert text == '{"success":true,"data":"after"}'
+        assert account.await_count == 2
+        assert assets.await_count == 1
+
+    async def test_failed_write_invalidates_account_state(self, make_server, clock):
+        """Test that a write whose handler raises still drops account state."""
+        server = make_server()
+        account = _stub(server, "get_account_state")
+        _stub(server, "cancel_all_orders", RuntimeError("timed out"))
+
+        await server._dispatch_one("get_account_state", {})
+        await server._dispatch_one("cancel_all_orders", {})
+        await server._dispatch_one("get_account_state", {})
+
+        assert account.await_count == 2
+
+    async def test_read_overlapping_write_is_not_cached(self, make_server, clock):
+        """Test that a read started before a write does not cache its result."""
+        server = make_server()
+        account = _stub(server, "get_account_state", delay=0.05)
+        _stub(server, "cancel_all_orders")
+
+        read = asyncio.ensure_future(server._dispatch_one("get_account_state", {}))
+        await asyncio.sleep(0)
+        await server._dispatch_one("cancel_all_orders", {})
+        await read
+        await server._dispatch_one("get_account_state", {})
+
+        assert account.await_count == 2
+        assert server._inflight == {}
+
+    async def test_read_after_write_does_not_join_older_flight(
+        self, make_server, clock
+    ):
+        """Test that a read issued after a write starts its own request."""
+        server = make_server()
+        account = _stub(
+            server,
+            "get_account_state",
+            {"success": True, "data": "before"},
+            {"success": True, "data": "after"},
+        )
+        _stub(server, "cancel_all_orders")
+        started = asyncio.Event()
+        release = asyncio.Event()
+        side_effects = iter(account.side_effect)
+
+        async def slow_first(**kwargs):
+            result = next(side_effects)
+            if not started.is_set():
+                started.set()
+                await release.wait()
+            return result
+
+        account.side_effect = slow_first
+
+        stale = asyncio.ensure_future(server._dispatch_one("get_account_state", {}))
+        await started.wait()
+        await server._dispatch_one("cancel_all_orders", {})
+        fresh = asyncio.ensure_future(server._dispatch_one("get_account_state", {}))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await stale == '{"success":true,"data":"before"}'
+        assert await fresh == '{"success":true,"data":"after"}'
+        assert server._inflight == {}
+
+    async def test_cache_is_bounded(self, make_server, clock):
+        """Test that the least recently used results are evicted."""
+        with patch("hype_mcp.server._RESULT_CACHE_SIZE", 2):
+            server = make_server()
+        handler = _stub(server, "get_all_assets")
+
+        for limit in (1, 2, 3, 1):
+            await server._dispatch_one("get_all_assets", {"limit": limit})
+
+        assert len(server._result_cache) == 2
+        assert handler.await_count == 4
+
+
+class TestConcurrencyLimit:
+    """Tests for the cap on concurrent handler calls."""
+
+    async def test_handlers_never_exceed_max_concurrency(
+        self, make_server, test_config
+    ):
+        """Test that a large batch runs at most max_concurrency handlers at once."""
+        test_config.max_concurrency = 2
+        server = make_server(test_config)
+        active = peak = 0
+
+        async def handler(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"success": True, "data": None}
+
+        server._tool_handlers["cancel_all_orders"] = handler
+        calls = [{"name": "cancel_all_orders"} for _ in range(6)]
+
+        result = await _call(server, "batch_call", {"calls": calls})
+
+        assert len(result["data"]) == 6
+        assert peak == 2
+
+
+class TestParameterPrevalidation:
+    """Tests for rejecting malformed arguments before the helpers are built."""
+
+    @pytest.mark.parametrize(
+        ("name", "arguments", "field"),
+        [
+            (
+                "place_perp_order",
+                {"symbol": "BTC", "side": "buy", "size": -1, "leverage": 5},
+                "size",
+            ),
+            (
+                "place_spot_order",
+                {"symbol": "PURR", "side": "buy", "size": 1, "order_type": "limit"},
+                "",
+            ),
+            ("get_market_data", {"symbol": ""}, "symbol"),
+            ("close_position", {"symbol": "BTC", "size": 0}, "size"),
+        ],
+    )
+    async def test_invalid_arguments_skip_helpers(
+        self, make_server, name, arguments, field
+    ):
+        """Test that invalid input returns a validation error without API calls."""
+        server = make_server()
+        server.client_manager.get_info = AsyncMock()
+        handler = _stub(server, name)
+
+        result = json.loads(await server._dispatch_one(name, arguments))
+
+        assert result["success"] is False
+        assert result["error_type"] == "ValidationError"
+        assert result["details"]["field"] == field
+        assert result["details"]["validation_errors"]
+        server.client_manager.get_info.assert_not_awaited()
+        handler.assert_not_awaited()
+        assert server.decimal_manager is None
+        assert server.asset_router is None
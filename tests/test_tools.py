@@ -1,7 +1,7 @@
 """Tests for MCP tools."""
 
 from typing import cast
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -21,6 +21,7 @@ def mock_client_manager():
     manager = Mock(spec=HyperliquidClientManager)
     manager.wallet_address = "0x1234567890123456789012345678901234567890"
     manager.info = Mock()
+    manager.get_info = AsyncMock(return_value=manager.info)
     return manager
 
 
@@ -76,6 +77,33 @@ async def test_get_open_orders_success(mock_client_manager):
     mock_client_manager.info.open_orders.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_open_orders_paginated(mock_client_manager):
+    """Test get_open_orders returns a page and the next cursor."""
+    mock_client_manager.info.open_orders.return_value = [
+        {"oid": 1},
+        {"oid": 2},
+        {"oid": 3},
+    ]
+
+    first = await get_open_orders(mock_client_manager, limit=2)
+    second = await get_open_orders(mock_client_manager, limit=2, cursor=2)
+
+    assert first["data"] == [{"oid": 1}, {"oid": 2}]
+    assert first["next_cursor"] == 2
+    assert second["data"] == [{"oid": 3}]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_open_orders_invalid_limit(mock_client_manager):
+    """Test get_open_orders rejects a non-positive limit."""
+    result = await get_open_orders(mock_client_manager, limit=0)
+
+    assert result["success"] is False
+    mock_client_manager.info.open_orders.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_market_data_perp_success(mock_client_manager):
     """Test get_market_data for perpetual asset."""
@@ -189,6 +217,29 @@ async def test_get_all_assets_success(mock_client_manager):
     assert result["data"]["spot"][0]["name"] == "PURR"
 
 
+@pytest.mark.asyncio
+async def test_get_all_assets_paginated(mock_client_manager):
+    """Test get_all_assets pages perps and spot with one cursor."""
+    mock_client_manager.info.meta.return_value = {
+        "universe": [
+            {"name": "BTC", "szDecimals": 4, "maxLeverage": 50},
+            {"name": "ETH", "szDecimals": 3, "maxLeverage": 50},
+        ]
+    }
+    mock_client_manager.info.spot_meta.return_value = {
+        "tokens": [
+            {"name": "PURR", "szDecimals": 2, "index": 0},
+        ]
+    }
+
+    result = await get_all_assets(mock_client_manager, limit=1, cursor=1)
+
+    assert result["success"] is True
+    assert [a["name"] for a in result["data"]["perps"]] == ["ETH"]
+    assert result["data"]["spot"] == []
+    assert result["next_cursor"] is None
+
+
 @pytest.mark.asyncio
 async def test_error_handling(mock_client_manager):
     """Test error handling in tools."""
@@ -1,5 +1,7 @@
 """Tests for input validation and error handling."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -287,6 +289,14 @@ class TestFormatErrorResponse:
             assert result["error_type"] == "ValidationError"
             assert "side" in result["error"]
 
+    def test_format_pydantic_error_is_json_serializable(self):
+        """Test that custom validator errors can be encoded as JSON."""
+        try:
+            SpotOrderParams(symbol="BTC", side="invalid", size=100)
+        except ValidationError as e:
+            result = format_error_response(e)
+            assert "Side must be" in json.loads(json.dumps(result))["error"]
+
     def test_format_generic_exception(self):
         """Test formatting generic exception."""
         error = ValueError("Generic error")